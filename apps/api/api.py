@@ -5,42 +5,19 @@ Django-Ninja API 主配置
 """
 
 from ninja import NinjaAPI
-from ninja.security import HttpBearer
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from typing import Optional
+import logging
 
+# 导入认证组件
+from apps.api.auth import AUTH_BEARER
 
-class AuthBearer(HttpBearer):
-    """
-    JWT Token 认证类
-    
-    通过 HTTP Bearer Token 进行身份验证，验证 JWT Token 的有效性。
-    """
-    
-    def authenticate(self, request, token: str) -> Optional[str]:
-        """
-        验证 JWT Token
-        
-        Args:
-            request: Django 请求对象
-            token: JWT Token 字符串
-            
-        Returns:
-            如果验证成功返回用户标识，失败返回 None
-        """
-        from apps.authentication.services import AuthService
-        
-        try:
-            # 使用认证服务验证 Token
-            user_id = AuthService.verify_token(token)
-            if user_id:
-                request.user_id = user_id
-                return user_id
-        except Exception:
-            pass
-        
-        return None
+# 导入 JSON 解析器与渲染器
+from apps.api.renderers import OrjsonParser, OrjsonRenderer
+
+
+# 配置日志
+logger = logging.getLogger(__name__)
 
 
 # 创建 Ninja API 实例
@@ -69,6 +46,10 @@ api = NinjaAPI(
     
     # CSRF 配置 - 在测试模式下禁用CSRF
     csrf=not settings.TESTING,  # 测试模式下禁用CSRF保护
+    
+    # JSON 处理 - 使用 orjson 解析请求和渲染响应
+    parser=OrjsonParser(),
+    renderer=OrjsonRenderer(),
 )
 
 # 导入并添加认证路由
@@ -83,6 +64,19 @@ api.add_router('/users', users_router, tags=['用户管理'])
 from apps.api.routers.health.router import router as health_router
 api.add_router('/health', health_router, tags=['健康检查'], auth=None)
 
+# 异常响应模板（仅 message 随请求变化）
+_VALIDATION_ERROR_TEMPLATE = {"error": "验证错误", "message": None, "code": 422}
+_SERVER_ERROR_BODY = {
+    "error": "服务器内部错误",
+    "message": "发生了未知错误，请联系管理员",
+    "code": 500
+}
+_VALUE_ERROR_TEMPLATE = {"error": "参数错误", "message": None, "code": 400}
+
+# 缓存响应构造方法
+_create_response = api.create_response
+
+
 # 添加异常处理器
 @api.exception_handler(ValidationError)
 def validation_error_handler(request, exc):
@@ -99,13 +93,9 @@ def validation_error_handler(request, exc):
     else:
         message = str(exc)
     
-    return api.create_response(
+    return _create_response(
         request,
-        {
-            "error": "验证错误",
-            "message": message,
-            "code": 422
-        },
+        {**_VALIDATION_ERROR_TEMPLATE, "message": message},
         status=422
     )
 
@@ -117,19 +107,11 @@ def global_exception_handler(request, exc):
     
     捕获所有未处理的异常，返回统一的错误响应格式。
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.error(f"未处理的异常: {exc}", exc_info=True)
+    # 仅在 ERROR 级别启用时才格式化异常堆栈
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error("未处理的异常: %s", exc, exc_info=True)
     
-    return api.create_response(
-        request,
-        {
-            "error": "服务器内部错误",
-            "message": "发生了未知错误，请联系管理员",
-            "code": 500
-        },
-        status=500
-    )
+    return _create_response(request, _SERVER_ERROR_BODY, status=500)
 
 
 @api.exception_handler(ValueError)
@@ -139,14 +121,8 @@ def value_error_handler(request, exc):
     
     处理参数验证等值错误异常。
     """
-    return api.create_response(
+    return _create_response(
         request,
-        {
-            "error": "参数错误",
-            "message": str(exc),
-            "code": 400
-        },
+        {**_VALUE_ERROR_TEMPLATE, "message": str(exc)},
         status=400
     )
-
-
@@ -0,0 +1,193 @@
+"""
+API 认证组件
+
+定义 JWT Bearer 认证类及 Token 验证结果缓存，供各业务路由共享。
+"""
+
+from ninja.security import HttpBearer
+from asgiref.sync import sync_to_async
+from collections import OrderedDict
+from typing import Optional, Tuple
+import hashlib
+import threading
+import time
+
+# 导入认证服务
+from apps.authentication.services import AuthService
+
+
+# Token 验证结果缓存配置
+TOKEN_CACHE_MAXSIZE = 10000  # 最多缓存的 Token 数量
+TOKEN_CACHE_TTL = 5  # 缓存有效期（秒）
+
+
+class TokenCache:
+    """
+    JWT 验证结果缓存
+    
+    以 Token 的 SHA-256 摘要为键，在进程内缓存验证成功的 `(user_id, exp)`，
+    命中时跳过签名验证和数据库查询。缓存容量有限，超出时淘汰最久未使用的条目。
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        初始化缓存
+        
+        Args:
+            maxsize: 最大缓存条目数
+            ttl: 每个条目的有效期（秒）
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+    
+    @staticmethod
+    def _key(token: str) -> bytes:
+        """计算 Token 的缓存键"""
+        return hashlib.sha256(token.encode()).digest()
+    
+    def get(self, token: str) -> Optional[Tuple[int, int]]:
+        """
+        获取缓存的验证结果
+        
+        Args:
+            token: JWT Token 字符串
+            
+        Returns:
+            命中且未过期时返回 `(user_id, exp)`，否则返回 None
+        """
+        key = self._key(token)
+        now = time.time()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            user_id, exp, expires_at = entry
+            if expires_at <= now or exp <= now:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return user_id, exp
+    
+    def set(self, token: str, user_id: int, exp: int) -> None:
+        """
+        写入验证成功的结果
+        
+        Args:
+            token: JWT Token 字符串
+            user_id: 用户ID
+            exp: Token 过期时间戳
+        """
+        key = self._key(token)
+        with self._lock:
+            self._data[key] = (user_id, exp, time.time() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def discard(self, token: str) -> None:
+        """
+        移除指定 Token 的缓存结果
+        
+        Args:
+            token: JWT Token 字符串
+        """
+        key = self._key(token)
+        with self._lock:
+            self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._data.clear()
+
+
+# 全局 Token 验证缓存（由 AuthBearer 与令牌验证接口共享）
+token_cache = TokenCache(maxsize=TOKEN_CACHE_MAXSIZE, ttl=TOKEN_CACHE_TTL)
+
+
+def verify_token_cached(token: str) -> Optional[Tuple[int, int]]:
+    """
+    验证 JWT Token，优先使用缓存结果
+    
+    只缓存验证成功的结果，失败的 Token 每次都会重新验证。
+    
+    Args:
+        token: JWT Token 字符串
+        
+    Returns:
+        验证成功返回 `(user_id, exp)`，失败返回 None
+    """
+    result = token_cache.get(token)
+    if result is not None:
+        return result
+    
+    result = AuthService.verify_and_decode(token)
+    if result is not None:
+        token_cache.set(token, *result)
+    return result
+
+
+class AuthBearer(HttpBearer):
+    """
+    JWT Token 认证类
+    
+    通过 HTTP Bearer Token 进行身份验证，验证 JWT Token 的有效性。
+    """
+    
+    def authenticate(self, request, token: str) -> Optional[str]:
+        """
+        验证 JWT Token
+        
+        Args:
+            request: Django 请求对象
+            token: JWT Token 字符串
+            
+        Returns:
+            如果验证成功返回用户标识，失败返回 None
+        """
+        try:
+            # 使用认证服务验证 Token（带缓存）
+            result = verify_token_cached(token)
+            if result:
+                user_id = result[0]
+                request.user_id = user_id
+                # 保存原始 Token，便于账户删除等操作立即使其缓存失效
+                request.auth_token = token
+                return user_id
+        except Exception:
+            pass
+        
+        return None
+
+
+class AsyncAuthBearer(AuthBearer):
+    """
+    异步视图使用的 JWT Token 认证类
+    
+    Ninja 在事件循环中直接调用同步认证类，缓存未命中时的用户状态查询会触发
+    `SynchronousOnlyOperation`。此类将验证放到线程中执行，供 `async def` 端点使用。
+    """
+    
+    # 告知 Ninja 以协程方式调用
+    is_async = True
+    
+    async def __call__(self, request):
+        """
+        验证请求中的 Bearer Token
+        
+        Args:
+            request: Django 请求对象
+            
+        Returns:
+            如果验证成功返回用户标识，失败返回 None
+        """
+        return await sync_to_async(super().__call__)(request)
+
+
+# 共享的认证实例（所有需要认证的路由共用）
+AUTH_BEARER = AuthBearer()
+
+# 异步端点共享的认证实例
+ASYNC_AUTH_BEARER = AsyncAuthBearer()
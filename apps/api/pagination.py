@@ -0,0 +1,42 @@
+"""
+API 分页器
+
+提供支持估算总数的分页器，避免在大表上为每次分页请求执行 COUNT(*) 查询。
+"""
+
+from typing import Any
+
+from ninja.pagination import LimitOffsetPagination
+from ninja.conf import settings
+
+
+class EstimatedCountPagination(LimitOffsetPagination):
+    """
+    支持估算总数的偏移分页器
+    
+    视图在请求上设置 `estimated_count` 时直接使用该值作为总数，省去 COUNT(*) 查询；
+    未设置时与 `LimitOffsetPagination` 行为一致。
+    """
+    
+    def paginate_queryset(self, queryset, pagination, **params: Any) -> Any:
+        """
+        分页查询集
+        
+        Args:
+            queryset: 待分页的查询集
+            pagination: 分页参数
+            params: 视图参数（包含请求对象）
+        
+        Returns:
+            dict: 当前页数据和总数
+        """
+        estimated_count = getattr(params.get('request'), 'estimated_count', None)
+        if estimated_count is None:
+            return super().paginate_queryset(queryset, pagination, **params)
+        
+        offset = pagination.offset
+        limit = min(pagination.limit, settings.PAGINATION_MAX_LIMIT)
+        return {
+            'items': queryset[offset:offset + limit],
+            'count': estimated_count,
+        }
@@ -0,0 +1,53 @@
+"""
+API 请求解析器与响应渲染器
+
+使用 orjson 替代标准库 json 处理请求体解析和响应序列化。
+"""
+
+from ninja.parser import Parser
+from ninja.renderers import BaseRenderer
+from ninja.responses import NinjaJSONEncoder
+import orjson
+
+
+# orjson 不支持的类型（如 Pydantic 模型、Decimal、惰性翻译字符串）交由 Ninja 默认编码器处理
+_fallback_encoder = NinjaJSONEncoder()
+
+
+class OrjsonParser(Parser):
+    """基于 orjson 的 JSON 请求体解析器"""
+    
+    def parse_body(self, request):
+        """
+        解析请求体
+        
+        Args:
+            request: Django 请求对象
+        
+        Returns:
+            解析后的请求数据
+        """
+        return orjson.loads(request.body)
+
+
+class OrjsonRenderer(BaseRenderer):
+    """基于 orjson 的 JSON 响应渲染器"""
+    
+    media_type = 'application/json'
+    
+    # 时区为 UTC 的时间以 Z 结尾（与 Django 默认编码器一致），并允许非字符串字典键
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    
+    def render(self, request, data, *, response_status):
+        """
+        序列化响应数据
+        
+        Args:
+            request: Django 请求对象
+            data: 响应数据
+            response_status: HTTP 状态码
+        
+        Returns:
+            bytes: JSON 编码后的响应内容
+        """
+        return orjson.dumps(data, default=_fallback_encoder.default, option=self.options)
@@ -3,13 +3,16 @@
 提供功能：
 - `IntEnumChoices`：在 `IntEnum` 基础上为每个成员绑定人类可读的 `label`，行为与
   Django 的 `models.IntegerChoices` 类似。
-- `BusinessCode`：统一的业务码枚举。
+- `BusinessCode`：统一的业务码，成员为带 `label` 的不可变整型包装，标签见
+  `BUSINESS_CODE_LABELS`。
 - `HttpStatus`：常见的 HTTP 状态码枚举。
 - `ApiResponse`：统一构建成功/失败/异常/分页等响应的辅助方法。
 
 示例：
     >>> BusinessCode.OK.label
     '操作成功'
+    >>> BusinessCode(100401)
+    <BusinessCode.UNAUTHORIZED: 100401>
     >>> BusinessCode.get_label(100401)
     '未认证'
     >>> BusinessCode.choices()[:2]
@@ -35,10 +38,21 @@ class IntEnumChoices(IntEnum):
         obj.label = label
         return obj
 
+    @classmethod
+    def _get_label_map(cls) -> dict:
+        """返回 `{value: label}` 映射，首次调用时构建并缓存在类上。"""
+        label_map = cls.__dict__.get('_label_map')
+        if label_map is None:
+            label_map = {member.value: member.label for member in cls}
+            cls._label_map = label_map
+        return label_map
+
     @classmethod
     def get_label(cls, value: int, default=None) -> str:
         """根据枚举整型值返回对应成员的标签。
 
+        通过预先构建的 `{value: label}` 字典查找，不创建枚举实例也不依赖异常。
+
         Args:
             value: 要查询的枚举整型值。
             default: 查找失败时返回的默认标签。
@@ -47,8 +61,9 @@ class IntEnumChoices(IntEnum):
             指定值对应的标签；如果不存在该成员，则返回 `default`。
         """
         try:
-            return cls(value).label
-        except Exception:
+            return cls._get_label_map().get(value, default)
+        except TypeError:
+            # 不可哈希的值不可能是成员
             return default
 
     @classmethod
@@ -56,28 +71,110 @@ class IntEnumChoices(IntEnum):
         """返回所有成员的 `(value, label)` 列表。
 
         与 Django 字段的 `choices` 用法保持一致，便于在模型或序列化附近复用。
+        结果在首次调用后缓存，调用方不应修改返回的列表。
         """
-        return [(member.value, member.label) for member in cls]
+        choices = cls.__dict__.get('_choices')
+        if choices is None:
+            choices = [(member.value, member.label) for member in cls]
+            cls._choices = choices
+        return choices
 
 
-class BusinessCode(IntEnumChoices):
-    """统一的业务结果码，成员为整型值并携带人类可读标签。
+class BusinessCode(int):
+    """统一的业务结果码，成员为不可变的整型包装实例。
+
+    业务码位于每个错误响应的构建路径上，因此不使用枚举：成员是 `int` 子类实例，
+    `__slots__` 为空，不带实例字典；标签统一保存在模块级的 `BUSINESS_CODE_LABELS`
+    字典中，`label` 属性和 `get_label` 都只做一次字典查找。
 
     常用方式：
-        - 按名称访问：`BusinessCode.OK`
-        - 按值访问：`BusinessCode(100401)`
+        - 按名称访问：`BusinessCode.OK`（等于整数 `0`）
+        - 按值查找：`BusinessCode(100401)`（返回 `BusinessCode.UNAUTHORIZED`）
         - 获取标签：`BusinessCode.OK.label` 或 `BusinessCode.get_label(0)`
         - 获取选项：`BusinessCode.choices()`（返回 `(value, label)` 列表）
     """
-    OK = 0, "操作成功"
-    GENERIC_ERROR = 100100, "操作失败"
-    BAD_REQUEST = 100400, "请求错误"
-    UNAUTHORIZED = 100401, "未认证"
-    FORBIDDEN = 100403, "无权限"
-    NOT_FOUND = 100404, "资源不存在"
-    CONFLICT = 100409, "资源冲突"
-    UNPROCESSABLE_ENTITY = 100422, "参数验证失败"
-    INTERNAL_ERROR = 100500, "服务器内部错误"
+    __slots__ = ()
+
+    OK = 0
+    GENERIC_ERROR = 100100
+    BAD_REQUEST = 100400
+    UNAUTHORIZED = 100401
+    FORBIDDEN = 100403
+    NOT_FOUND = 100404
+    CONFLICT = 100409
+    UNPROCESSABLE_ENTITY = 100422
+    INTERNAL_ERROR = 100500
+
+    def __new__(cls, value):
+        """按整型值返回已定义的业务码成员。
+
+        Raises:
+            ValueError: 值不是已定义的业务码。
+        """
+        try:
+            return _BUSINESS_CODE_MEMBERS[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"{value!r} 不是有效的业务码") from None
+
+    def __repr__(self) -> str:
+        return f"<BusinessCode.{_BUSINESS_CODE_NAMES[self]}: {int(self)}>"
+
+    # 字符串化和格式化保持与整数一致
+    __str__ = int.__repr__
+    __format__ = int.__format__
+
+    @property
+    def label(self) -> str:
+        """业务码对应的标签。"""
+        return BUSINESS_CODE_LABELS[self]
+
+    @staticmethod
+    def get_label(value: int, default=None) -> str:
+        """根据业务码返回对应的标签。
+
+        Args:
+            value: 业务码整型值。
+            default: 查找失败时返回的默认标签。
+
+        Returns:
+            业务码对应的标签；如果不存在该业务码，则返回 `default`。
+        """
+        try:
+            return BUSINESS_CODE_LABELS.get(value, default)
+        except TypeError:
+            # 不可哈希的值不可能是业务码
+            return default
+
+    @staticmethod
+    def choices():
+        """返回所有业务码的 `(value, label)` 列表，调用方不应修改返回的列表。"""
+        return _BUSINESS_CODE_CHOICES
+
+
+# 将类属性中的整型常量替换为 BusinessCode 实例（绕过按值查找的 __new__）
+_BUSINESS_CODE_MEMBERS = {}
+_BUSINESS_CODE_NAMES = {}
+for _name, _value in list(vars(BusinessCode).items()):
+    if _name.isupper() and type(_value) is int:
+        _member = int.__new__(BusinessCode, _value)
+        setattr(BusinessCode, _name, _member)
+        _BUSINESS_CODE_MEMBERS[_value] = _member
+        _BUSINESS_CODE_NAMES[_value] = _name
+del _name, _value, _member
+
+# 业务码标签映射
+BUSINESS_CODE_LABELS = {
+    BusinessCode.OK: "操作成功",
+    BusinessCode.GENERIC_ERROR: "操作失败",
+    BusinessCode.BAD_REQUEST: "请求错误",
+    BusinessCode.UNAUTHORIZED: "未认证",
+    BusinessCode.FORBIDDEN: "无权限",
+    BusinessCode.NOT_FOUND: "资源不存在",
+    BusinessCode.CONFLICT: "资源冲突",
+    BusinessCode.UNPROCESSABLE_ENTITY: "参数验证失败",
+    BusinessCode.INTERNAL_ERROR: "服务器内部错误",
+}
+_BUSINESS_CODE_CHOICES = [(int(code), label) for code, label in BUSINESS_CODE_LABELS.items()]
 
 
 class HttpStatus(IntEnumChoices):
@@ -100,7 +197,7 @@ class ApiResponse:
     作为 HTTP 状态码。
     """
     @staticmethod
-    def success(data=None, message: str = None, code: int = 0, meta: dict=None):
+    def success(data=None, message: str = None, code: int = 0, meta: dict = None):
         """构建成功响应载荷。
 
         Args:
@@ -113,12 +210,10 @@ class ApiResponse:
             包含 `code`、`message`、`data` 及可选 `meta` 的字典。
         """
         msg = message or BusinessCode.get_label(code)
-        if meta:
-            meta["code"] = code
-            meta["message"] = msg
-            meta["data"] = data
-
-        return {"code": code, "message": msg, "data": data}
+        payload = {"code": code, "message": msg, "data": data}
+        if meta is not None:
+            payload["meta"] = meta
+        return payload
 
     @staticmethod
     def created(data=None, message: str = None) -> Tuple[dict, int]:
@@ -8,8 +8,12 @@ from ninja import Router
 from ninja import Schema
 from django.db import connection
 from django.core.cache import cache
-from datetime import datetime
+from asgiref.sync import sync_to_async
+from datetime import datetime, timezone
+import asyncio
 import logging
+import time
+import weakref
 
 # 创建路由实例
 router = Router()
@@ -17,6 +21,28 @@ router = Router()
 # 配置日志
 logger = logging.getLogger(__name__)
 
+try:
+    import psutil
+    # 预热 CPU 采样，后续以非阻塞方式读取两次调用之间的使用率
+    psutil.cpu_percent(interval=None)
+except ImportError:
+    psutil = None
+
+# 系统资源采样结果的缓存时间（秒）
+SYSTEM_STATS_TTL = 1.0
+
+# 系统资源采样缓存：(采样时间, 检查结果)
+_system_stats_cache = (0.0, None)
+
+# 基础健康检查结果的缓存时间（秒）
+HEALTH_CHECK_TTL = 2.0
+
+# 基础健康检查结果缓存：(过期时间, 检查结果)
+_health_cache = (0.0, None)
+
+# 基础健康检查刷新锁：按事件循环分别创建（asyncio.Lock 不能跨事件循环使用）
+_health_locks = weakref.WeakKeyDictionary()
+
 
 class HealthResponse(Schema):
     """健康检查响应模式"""
@@ -34,38 +60,146 @@ class HealthDetailResponse(Schema):
     checks: dict  # 各项检查详情
 
 
-@router.get("/", response=HealthResponse)
-def health_check(request):
+def _probe_database() -> str:
     """
-    基础健康检查
-    
-    检查系统的基本运行状态，包括数据库和缓存连接。
+    探测数据库连接
     
     Returns:
-        HealthResponse: 包含系统状态信息的响应
+        str: 数据库状态，"healthy" 或 "unhealthy"
     """
-    timestamp = datetime.now().isoformat()
-    
-    # 检查数据库连接
-    db_status = "healthy"
     try:
         with connection.cursor() as cursor:
             cursor.execute("SELECT 1")
             cursor.fetchone()
+        return "healthy"
     except Exception as e:
-        db_status = "unhealthy"
-        logger.error(f"数据库连接检查失败: {e}")
+        logger.error("数据库连接检查失败: %s", e)
+        return "unhealthy"
+
+
+def _probe_cache() -> str:
+    """
+    探测缓存读写
     
-    # 检查缓存连接
-    cache_status = "healthy"
+    Returns:
+        str: 缓存状态，"healthy" 或 "unhealthy"
+    """
     try:
-        cache.set("health_check", timestamp, timeout=5)
-        cached_value = cache.get("health_check")
-        if cached_value != timestamp:
-            cache_status = "unhealthy"
+        # 使用纳秒时间戳（整型）作为探测值，避免每次格式化字符串
+        nonce = time.time_ns()
+        cache.set("health_check", nonce, timeout=5)
+        if cache.get("health_check") != nonce:
+            return "unhealthy"
+        return "healthy"
     except Exception as e:
-        cache_status = "unhealthy"
-        logger.error(f"缓存连接检查失败: {e}")
+        logger.error("缓存连接检查失败: %s", e)
+        return "unhealthy"
+
+
+def _get_health_lock() -> asyncio.Lock:
+    """
+    获取当前事件循环的健康检查刷新锁
+    
+    Returns:
+        asyncio.Lock: 当前事件循环专用的锁
+    """
+    loop = asyncio.get_running_loop()
+    lock = _health_locks.get(loop)
+    if lock is None:
+        lock = _health_locks[loop] = asyncio.Lock()
+    return lock
+
+
+def _collect_system_checks() -> dict:
+    """
+    采集系统资源使用情况
+    
+    CPU 使用率以非阻塞方式读取，采样结果在 `SYSTEM_STATS_TTL` 秒内复用。
+    
+    Returns:
+        dict: 系统资源检查结果
+    """
+    global _system_stats_cache
+    
+    if psutil is None:
+        return {"psutil": "not_available"}
+    
+    sampled_at, cached = _system_stats_cache
+    now = time.monotonic()
+    if cached is not None and now - sampled_at < SYSTEM_STATS_TTL:
+        return cached
+    
+    system_checks = {}
+    try:
+        # CPU 使用率（自上次采样以来）
+        cpu_percent = psutil.cpu_percent(interval=None)
+        system_checks["cpu_percent"] = cpu_percent
+        system_checks["cpu_status"] = "healthy" if cpu_percent < 80 else "warning"
+        
+        # 内存使用率
+        memory = psutil.virtual_memory()
+        system_checks["memory_percent"] = memory.percent
+        system_checks["memory_status"] = "healthy" if memory.percent < 80 else "warning"
+        system_checks["memory_available_gb"] = round(memory.available / (1024**3), 2)
+        
+        # 磁盘使用率
+        disk = psutil.disk_usage('/')
+        system_checks["disk_percent"] = disk.percent
+        system_checks["disk_status"] = "healthy" if disk.percent < 80 else "warning"
+        system_checks["disk_free_gb"] = round(disk.free / (1024**3), 2)
+        
+    except Exception as e:
+        system_checks["error"] = str(e)
+        logger.error("系统资源检查失败: %s", e)
+        return system_checks
+    
+    _system_stats_cache = (now, system_checks)
+    return system_checks
+
+
+@router.get("/", response=HealthResponse)
+async def health_check(request):
+    """
+    基础健康检查
+    
+    并发检查系统的基本运行状态，包括数据库和缓存连接。检查结果在
+    `HEALTH_CHECK_TTL` 秒内复用；缓存过期时刷新过程由锁串行化，
+    同一事件循环内并发到达的请求等待首个请求的检查结果，不重复探测。
+    
+    Returns:
+        HealthResponse: 包含系统状态信息的响应
+    """
+    global _health_cache
+    
+    expiry, cached = _health_cache
+    if cached is not None and time.monotonic() < expiry:
+        return cached
+    
+    async with _get_health_lock():
+        # 等待锁期间其他请求可能已完成刷新
+        expiry, cached = _health_cache
+        if cached is not None and time.monotonic() < expiry:
+            return cached
+        
+        result = await _run_health_checks()
+        _health_cache = (time.monotonic() + HEALTH_CHECK_TTL, result)
+        return result
+
+
+async def _run_health_checks() -> HealthResponse:
+    """
+    执行数据库和缓存探测
+    
+    Returns:
+        HealthResponse: 本次检查结果
+    """
+    timestamp = datetime.now(timezone.utc).isoformat(timespec='seconds')
+    
+    # 数据库探测保持在线程敏感模式（连接按线程管理），缓存探测在独立线程中并发执行
+    db_status, cache_status = await asyncio.gather(
+        sync_to_async(_probe_database)(),
+        sync_to_async(_probe_cache, thread_sensitive=False)(),
+    )
     
     # 确定整体状态
     overall_status = "healthy" if db_status == "healthy" and cache_status == "healthy" else "unhealthy"
@@ -89,30 +223,22 @@ def health_check_detailed(request):
     Returns:
         HealthDetailResponse: 包含详细检查信息的响应
     """
-    timestamp = datetime.now().isoformat()
+    timestamp = datetime.now(timezone.utc).isoformat(timespec='seconds')
     checks = {}
     
     # 数据库详细检查
     db_checks = {}
     try:
         with connection.cursor() as cursor:
-            # 检查连接
-            cursor.execute("SELECT 1")
-            cursor.fetchone()
-            db_checks["connection"] = "healthy"
-            
-            # 检查响应时间
-            import time
+            # 连接检查与连接数统计合并为一次查询（PostgreSQL 特定查询）
             start_time = time.time()
-            cursor.execute("SELECT COUNT(*) FROM pg_stat_activity")  # PostgreSQL 特定查询
-            cursor.fetchone()
+            cursor.execute("SELECT 1, (SELECT count(*) FROM pg_stat_activity)")
+            row = cursor.fetchone()
             response_time = (time.time() - start_time) * 1000  # 转换为毫秒
-            db_checks["response_time_ms"] = round(response_time, 2)
             
-            # 检查连接数（PostgreSQL）
-            cursor.execute("SELECT count(*) FROM pg_stat_activity")
-            connection_count = cursor.fetchone()[0]
-            db_checks["active_connections"] = connection_count
+            db_checks["connection"] = "healthy"
+            db_checks["response_time_ms"] = round(response_time, 2)
+            db_checks["active_connections"] = row[1]
             
     except Exception as e:
         db_checks["connection"] = "unhealthy"
@@ -126,7 +252,7 @@ def health_check_detailed(request):
     try:
         # 基本连接测试
         test_key = "health_check_detailed"
-        test_value = timestamp
+        test_value = time.time_ns()
         cache.set(test_key, test_value, timeout=10)
         cached_value = cache.get(test_key)
         
@@ -153,34 +279,7 @@ def health_check_detailed(request):
     checks["cache"] = cache_checks
     
     # 系统资源检查
-    system_checks = {}
-    try:
-        import psutil
-        
-        # CPU 使用率
-        cpu_percent = psutil.cpu_percent(interval=1)
-        system_checks["cpu_percent"] = cpu_percent
-        system_checks["cpu_status"] = "healthy" if cpu_percent < 80 else "warning"
-        
-        # 内存使用率
-        memory = psutil.virtual_memory()
-        system_checks["memory_percent"] = memory.percent
-        system_checks["memory_status"] = "healthy" if memory.percent < 80 else "warning"
-        system_checks["memory_available_gb"] = round(memory.available / (1024**3), 2)
-        
-        # 磁盘使用率
-        disk = psutil.disk_usage('/')
-        system_checks["disk_percent"] = disk.percent
-        system_checks["disk_status"] = "healthy" if disk.percent < 80 else "warning"
-        system_checks["disk_free_gb"] = round(disk.free / (1024**3), 2)
-        
-    except ImportError:
-        system_checks["psutil"] = "not_available"
-    except Exception as e:
-        system_checks["error"] = str(e)
-        logger.error(f"系统资源检查失败: {e}")
-    
-    checks["system"] = system_checks
+    checks["system"] = _collect_system_checks()
     
     # 确定整体状态
     overall_status = "healthy"
@@ -7,19 +7,18 @@
 from ninja import Router
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
-from django.core.mail import send_mail
-from django.views.decorators.csrf import csrf_exempt
 from django.contrib.auth import login as django_login
 from django.contrib.auth import logout as django_logout
-from django.utils.decorators import method_decorator
+from asgiref.sync import sync_to_async
 from datetime import datetime
 import logging
 
 # 导入认证类
-from apps.api.api import AuthBearer
+from apps.api.auth import AUTH_BEARER, ASYNC_AUTH_BEARER, token_cache, verify_token_cached
 
 # 导入服务
 from .services import AuthService
+from apps.users.services import UserService
 
 # 导入模式
 from .schemas import (
@@ -38,10 +37,42 @@ router = Router()
 # 配置日志
 logger = logging.getLogger(__name__)
 
+# /me 接口只读取的用户字段
+USER_INFO_FIELDS = (
+    'id', 'username', 'email', 'nickname', 'user_type',
+    'status', 'email_verified', 'phone_verified',
+)
+
+# 修改密码所需的用户字段（包含密码相似度校验和保存信号会读取的字段）
+PASSWORD_CHANGE_FIELDS = (
+    'id', 'password', 'username', 'email',
+    'first_name', 'last_name', 'phone_number',
+)
+
+
+def _complete_login(request, user) -> None:
+    """
+    完成登录后的会话处理
+    
+    建立 Django 会话并记录最后登录信息。
+    
+    Args:
+        request: Django 请求对象
+        user: 已认证的用户实例
+    """
+    # 建立Django会话登录（用于模板中的 user.is_authenticated）
+    try:
+        django_login(request, user)
+    except Exception:
+        pass
+    
+    # 更新最后登录IP
+    ip_address = request.META.get('REMOTE_ADDR')
+    user.update_last_login_info(ip_address)
+
 
 @router.post("/login", response=LoginResponse, auth=None)
-@method_decorator(csrf_exempt, name='dispatch')
-def login(request, login_data: LoginRequest):
+async def login(request, login_data: LoginRequest):
     """
     用户登录
     
@@ -57,45 +88,31 @@ def login(request, login_data: LoginRequest):
     Raises:
         ValidationError: 当登录失败时抛出
     """
-    try:
-        # 用户认证
-        user = AuthService.authenticate_user(login_data.username, login_data.password)
-        
-        if not user:
-            raise ValidationError("用户名或密码错误")
-        
-        # 生成令牌
-        token_data = AuthService.generate_tokens(user)
-        
-        # 建立Django会话登录（用于模板中的 user.is_authenticated）
-        try:
-            django_login(request, user)
-        except Exception:
-            pass
-        
-        # 更新最后登录IP
-        ip_address = request.META.get('REMOTE_ADDR')
-        user.update_last_login_info(ip_address)
-        
-        logger.info(f"用户登录成功: {user.username}")
-        
-        return LoginResponse(
-            access_token=token_data['access_token'],
-            refresh_token=token_data['refresh_token'],
-            token_type=token_data['token_type'],
-            expires_in=token_data['expires_in'],
-            user_id=user.id
-        )
-        
-    except ValidationError:
-        raise
-    except Exception as e:
-        logger.error(f"用户登录失败: {e}", exc_info=True)
-        raise ValidationError("登录失败，请稍后重试")
+    # 用户认证
+    user = await sync_to_async(AuthService.authenticate_user)(login_data.username, login_data.password)
+    
+    if not user:
+        raise ValidationError("用户名或密码错误")
+    
+    # 生成令牌
+    token_data = await sync_to_async(AuthService.generate_tokens)(user)
+    
+    # 建立会话并更新最后登录信息
+    await sync_to_async(_complete_login)(request, user)
+    
+    logger.info("用户登录成功: %s", user.username)
+    
+    return LoginResponse(
+        access_token=token_data['access_token'],
+        refresh_token=token_data['refresh_token'],
+        token_type=token_data['token_type'],
+        expires_in=token_data['expires_in'],
+        user_id=user.id
+    )
 
 
 @router.post("/refresh", response=RefreshTokenResponse, auth=None)
-def refresh_token(request, refresh_data: RefreshTokenRequest):
+async def refresh_token(request, refresh_data: RefreshTokenRequest):
     """
     刷新访问令牌
     
@@ -111,28 +128,21 @@ def refresh_token(request, refresh_data: RefreshTokenRequest):
     Raises:
         ValidationError: 当刷新失败时抛出
     """
-    try:
-        # 验证刷新令牌并生成新的访问令牌
-        token_data = AuthService.refresh_access_token(refresh_data.refresh_token)
-        
-        if not token_data:
-            raise ValidationError("刷新令牌无效或已过期")
-        
-        return RefreshTokenResponse(
-            access_token=token_data['access_token'],
-            token_type=token_data['token_type'],
-            expires_in=token_data['expires_in']
-        )
-        
-    except ValidationError:
-        raise
-    except Exception as e:
-        logger.error(f"令牌刷新失败: {e}")
-        raise ValidationError("令牌刷新失败，请重新登录")
+    # 验证刷新令牌并生成新的访问令牌
+    token_data = await sync_to_async(AuthService.refresh_access_token)(refresh_data.refresh_token)
+    
+    if not token_data:
+        raise ValidationError("刷新令牌无效或已过期")
+    
+    return RefreshTokenResponse(
+        access_token=token_data['access_token'],
+        token_type=token_data['token_type'],
+        expires_in=token_data['expires_in']
+    )
 
 
-@router.post("/logout", response=LogoutResponse, auth=AuthBearer())
-def logout(request, logout_data: LogoutRequest):
+@router.post("/logout", response=LogoutResponse, auth=ASYNC_AUTH_BEARER)
+async def logout(request, logout_data: LogoutRequest):
     """
     用户登出
     
@@ -152,22 +162,22 @@ def logout(request, logout_data: LogoutRequest):
         if user_id:
             # 执行登出操作
             refresh_token = logout_data.refresh_token if logout_data.refresh_token else None
-            AuthService.logout_user(user_id, refresh_token)
+            await sync_to_async(AuthService.logout_user)(user_id, refresh_token)
             try:
-                django_logout(request)
+                await sync_to_async(django_logout)(request)
             except Exception:
                 pass
-            logger.info(f"用户登出成功: {user_id}")
+            logger.info("用户登出成功: %s", user_id)
         
         return LogoutResponse(message="登出成功")
         
     except Exception as e:
-        logger.error(f"用户登出失败: {e}")
+        logger.error("用户登出失败: %s", e)
         return LogoutResponse(message="登出失败")
 
 
 @router.post("/validate", response=TokenValidationResponse, auth=None)
-def validate_token(request, validation_data: TokenValidationRequest):
+async def validate_token(request, validation_data: TokenValidationRequest):
     """
     验证访问令牌
     
@@ -180,39 +190,26 @@ def validate_token(request, validation_data: TokenValidationRequest):
     Returns:
         TokenValidationResponse: 令牌验证结果
     """
-    try:
-        # 验证 Token 格式
-        if not AuthService.validate_token_format(validation_data.token):
-            return TokenValidationResponse(valid=False)
-        
-        # 验证 Token 有效性
-        user_id = AuthService.verify_token(validation_data.token)
-        
-        if user_id:
-            # 获取 Token 过期时间
-            import jwt
-            payload = jwt.decode(
-                validation_data.token,
-                settings.JWT_SECRET_KEY,
-                algorithms=[settings.JWT_ALGORITHM]
-            )
-            expires_at = datetime.fromtimestamp(payload['exp']).isoformat()
-            
-            return TokenValidationResponse(
-                valid=True,
-                user_id=user_id,
-                expires_at=expires_at
-            )
-        else:
-            return TokenValidationResponse(valid=False)
-            
-    except Exception as e:
-        logger.error(f"令牌验证失败: {e}")
+    # 命中验证缓存时直接返回，未命中再到线程中验证 Token（格式错误的 Token 同样会在解码时被拒绝）
+    result = token_cache.get(validation_data.token)
+    if result is None:
+        result = await sync_to_async(verify_token_cached)(validation_data.token)
+    
+    if result:
+        user_id, exp = result
+        expires_at = datetime.fromtimestamp(exp).isoformat()
+        
+        return TokenValidationResponse(
+            valid=True,
+            user_id=user_id,
+            expires_at=expires_at
+        )
+    else:
         return TokenValidationResponse(valid=False)
 
 
-@router.get("/me", response=UserInfoResponse, auth=AuthBearer())
-def get_current_user_info(request):
+@router.get("/me", response=UserInfoResponse, auth=ASYNC_AUTH_BEARER)
+async def get_current_user_info(request):
     """
     获取当前用户信息
     
@@ -234,8 +231,8 @@ def get_current_user_info(request):
         if not user_id:
             raise ValidationError("用户未认证")
         
-        # 获取用户信息
-        user = User.objects.get(id=user_id, is_deleted=False)
+        # 获取用户信息（只查询需要的字段）
+        user = await User.active.only(*USER_INFO_FIELDS).aget(pk=user_id)
         
         return UserInfoResponse(
             user_id=user.id,
@@ -250,9 +247,6 @@ def get_current_user_info(request):
         
     except User.DoesNotExist:
         raise ValidationError("用户不存在")
-    except Exception as e:
-        logger.error(f"获取用户信息失败: {e}")
-        raise ValidationError("获取用户信息失败")
 
 
 @router.post("/password/reset", response=dict, auth=None)
@@ -269,36 +263,19 @@ def request_password_reset(request, reset_data: PasswordResetRequest):
     Returns:
         dict: 操作结果消息
     """
-    try:
-        # 查找用户
-        user = User.objects.filter(email=reset_data.email, is_deleted=False).first()
-        
-        if not user:
-            # 为了安全，不暴露用户是否存在
-            return {"message": "如果邮箱存在，重置邮件已发送"}
-        
-        # 生成重置令牌
-        reset_token = AuthService.generate_password_reset_token(user)
-        
-        # 发送重置邮件（这里简化处理，实际应该使用异步任务）
-        try:
-            reset_url = f"{request.build_absolute_uri('/')}auth/password/reset/confirm?token={reset_token}"
-            send_mail(
-                subject='密码重置请求',
-                message=f'请点击以下链接重置您的密码：{reset_url}',
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[user.email],
-                fail_silently=True,
-            )
-            logger.info(f"密码重置邮件发送成功: {user.email}")
-        except Exception as e:
-            logger.error(f"密码重置邮件发送失败: {e}")
-        
+    # 查找用户（只加载签发令牌和发送邮件所需的字段）
+    user = User.active.filter(
+        email=reset_data.email
+    ).only('id', 'username', 'email').first()
+    
+    if not user:
+        # 为了安全，不暴露用户是否存在
         return {"message": "如果邮箱存在，重置邮件已发送"}
-        
-    except Exception as e:
-        logger.error(f"密码重置请求失败: {e}")
-        return {"message": "密码重置请求失败，请稍后重试"}
+    
+    # 在后台签发重置令牌并发送邮件，不阻塞当前请求
+    AuthService.enqueue_password_reset(user, request.build_absolute_uri('/'))
+    
+    return {"message": "如果邮箱存在，重置邮件已发送"}
 
 
 @router.post("/password/reset/confirm", response=dict, auth=None)
@@ -315,23 +292,16 @@ def confirm_password_reset(request, reset_data: PasswordResetConfirm):
     Returns:
         dict: 操作结果消息
     """
-    try:
-        # 验证并重置密码
-        success = AuthService.reset_user_password(reset_data.token, reset_data.new_password)
-        
-        if success:
-            return {"message": "密码重置成功"}
-        else:
-            raise ValidationError("密码重置失败，令牌可能已过期")
-            
-    except ValidationError:
-        raise
-    except Exception as e:
-        logger.error(f"密码重置失败: {e}")
-        raise ValidationError("密码重置失败，请稍后重试")
+    # 验证并重置密码
+    success = AuthService.reset_user_password(reset_data.token, reset_data.new_password)
+    
+    if success:
+        return {"message": "密码重置成功"}
+    else:
+        raise ValidationError("密码重置失败，令牌可能已过期")
 
 
-@router.post("/password/change", response=dict, auth=AuthBearer())
+@router.post("/password/change", response=dict, auth=AUTH_BEARER)
 def change_password(request, change_data: PasswordChangeRequest):
     """
     修改密码
@@ -355,8 +325,8 @@ def change_password(request, change_data: PasswordChangeRequest):
         if not user_id:
             raise ValidationError("用户未认证")
         
-        # 获取用户
-        user = User.objects.get(id=user_id, is_deleted=False)
+        # 获取用户（只查询需要的字段）
+        user = User.active.only(*PASSWORD_CHANGE_FIELDS).get(pk=user_id)
         
         # 更新密码
         success = UserService.update_password(
@@ -374,8 +344,3 @@ def change_password(request, change_data: PasswordChangeRequest):
             
     except User.DoesNotExist:
         raise ValidationError("用户不存在")
-    except ValidationError:
-        raise
-    except Exception as e:
-        logger.error(f"密码修改失败: {e}")
-        raise ValidationError("密码修改失败，请稍后重试")
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""
+认证后端
+
+在 Django 默认模型认证后端的基础上，会话认证加载用户时一并查询用户资料。
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+# 获取用户模型
+User = get_user_model()
+
+
+class ProfileModelBackend(ModelBackend):
+    """
+    预加载用户资料的模型认证后端
+    
+    `request.user` 由会话中的用户 ID 通过 `get_user` 加载，这里使用 `select_related`
+    连同用户资料一次查询，页面中访问 `user.profile` 不再触发额外查询。
+    """
+    
+    def get_user(self, user_id):
+        """
+        根据用户 ID 获取用户（包含用户资料）
+        
+        Args:
+            user_id: 用户ID
+            
+        Returns:
+            User: 有效的用户实例，不存在或不可登录时返回 None
+        """
+        try:
+            user = User._default_manager.select_related('profile').get(pk=user_id)
+        except User.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,20 @@
+"""
+密码哈希器
+
+提供参数调优后的 Argon2id 哈希器，作为默认的密码哈希算法。
+"""
+
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    调优的 Argon2id 密码哈希器
+    
+    使用 64 MB 内存、2 次迭代、2 个并行线程，在保持抗 GPU 破解能力的同时
+    降低注册和登录时的哈希耗时；参数变更后，旧哈希会在下次登录时自动重新计算。
+    """
+    
+    time_cost = 2
+    memory_cost = 65536
+    parallelism = 2
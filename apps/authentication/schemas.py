@@ -5,11 +5,27 @@
 """
 
 from ninja import Schema
-from typing import Optional
-from pydantic import Field, EmailStr
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field, EmailStr
 
+# 复用用户模块的格式定义
+from apps.users.schemas import PHONE_PATTERN, USERNAME_SEPARATORS
 
-class LoginRequest(Schema):
+
+class RequestSchema(BaseModel):
+    """
+    请求体模式基类
+    
+    请求体只会从已解析的 JSON 字典构造，不需要 Ninja `Schema` 为 ORM 对象提供的
+    `DjangoGetter` 包装和解析器，直接继承 `BaseModel` 使校验完全在 pydantic-core 中完成。
+    """
+    
+    def dict(self, *args, **kwargs) -> Dict[str, Any]:
+        """与 Ninja `Schema.dict` 保持兼容"""
+        return self.model_dump(*args, **kwargs)
+
+
+class LoginRequest(RequestSchema):
     """登录请求模式"""
     username: str = Field(..., description='用户名、邮箱或手机号')
     password: str = Field(..., description='密码')
@@ -25,7 +41,7 @@ class LoginResponse(Schema):
     user_id: int = Field(..., description='用户ID')
 
 
-class RefreshTokenRequest(Schema):
+class RefreshTokenRequest(RequestSchema):
     """刷新令牌请求模式"""
     refresh_token: str = Field(..., description='刷新令牌')
 
@@ -37,7 +53,7 @@ class RefreshTokenResponse(Schema):
     expires_in: int = Field(..., description='令牌过期时间（秒）')
 
 
-class LogoutRequest(Schema):
+class LogoutRequest(RequestSchema):
     """登出请求模式"""
     refresh_token: Optional[str] = Field(None, description='刷新令牌（可选）')
 
@@ -47,12 +63,12 @@ class LogoutResponse(Schema):
     message: str = Field(..., description='登出成功消息')
 
 
-class PasswordResetRequest(Schema):
+class PasswordResetRequest(RequestSchema):
     """密码重置请求模式"""
     email: EmailStr = Field(..., description='注册邮箱')
 
 
-class PasswordResetConfirm(Schema):
+class PasswordResetConfirm(RequestSchema):
     """密码重置确认模式"""
     token: str = Field(..., description='重置令牌')
     new_password: str = Field(..., min_length=8, max_length=128, description='新密码')
@@ -65,7 +81,7 @@ class PasswordResetConfirm(Schema):
         return v
 
 
-class PasswordChangeRequest(Schema):
+class PasswordChangeRequest(RequestSchema):
     """密码修改请求模式"""
     old_password: str = Field(..., description='当前密码')
     new_password: str = Field(..., min_length=8, max_length=128, description='新密码')
@@ -78,7 +94,7 @@ class PasswordChangeRequest(Schema):
         return v
 
 
-class TokenValidationRequest(Schema):
+class TokenValidationRequest(RequestSchema):
     """令牌验证请求模式"""
     token: str = Field(..., description='要验证的令牌')
 
@@ -102,14 +118,14 @@ class UserInfoResponse(Schema):
     phone_verified: bool = Field(..., description='手机验证状态')
 
 
-class RegisterRequest(Schema):
+class RegisterRequest(RequestSchema):
     """注册请求模式"""
     username: str = Field(..., min_length=3, max_length=150, description='用户名')
     email: EmailStr = Field(..., description='邮箱地址')
     password: str = Field(..., min_length=8, max_length=128, description='密码')
     password_confirm: str = Field(..., min_length=8, max_length=128, description='确认密码')
     nickname: Optional[str] = Field(None, max_length=50, description='昵称')
-    phone_number: Optional[str] = Field(None, pattern=r'^1[3-9]\d{9}$', description='手机号码')
+    phone_number: Optional[str] = Field(None, pattern=PHONE_PATTERN, description='手机号码')
     
     def validate_passwords_match(cls, v, values):
         """验证密码是否匹配"""
@@ -119,7 +135,7 @@ class RegisterRequest(Schema):
     
     def validate_username_format(cls, v):
         """验证用户名格式"""
-        if not v.replace('_', '').replace('-', '').isalnum():
+        if not v.translate(USERNAME_SEPARATORS).isalnum():
             raise ValueError('用户名只能包含字母、数字、下划线和连字符')
         return v.lower()
 
@@ -132,22 +148,22 @@ class RegisterResponse(Schema):
     refresh_token: str = Field(..., description='刷新令牌')
 
 
-class EmailVerificationRequest(Schema):
+class EmailVerificationRequest(RequestSchema):
     """邮箱验证请求模式"""
     email: EmailStr = Field(..., description='待验证邮箱')
 
 
-class EmailVerificationConfirm(Schema):
+class EmailVerificationConfirm(RequestSchema):
     """邮箱验证确认模式"""
     token: str = Field(..., description='验证令牌')
 
 
-class PhoneVerificationRequest(Schema):
+class PhoneVerificationRequest(RequestSchema):
     """手机验证请求模式"""
-    phone_number: str = Field(..., pattern=r'^1[3-9]\d{9}$', description='手机号码')
+    phone_number: str = Field(..., pattern=PHONE_PATTERN, description='手机号码')
 
 
-class PhoneVerificationConfirm(Schema):
+class PhoneVerificationConfirm(RequestSchema):
     """手机验证确认模式"""
-    phone_number: str = Field(..., pattern=r'^1[3-9]\d{9}$', description='手机号码')
+    phone_number: str = Field(..., pattern=PHONE_PATTERN, description='手机号码')
     code: str = Field(..., min_length=4, max_length=6, description='验证码')
\ No newline at end of file
@@ -5,16 +5,23 @@
 """
 
 import jwt
-import secrets
 import hashlib
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, Tuple
+import hmac
+import base64
+import json
+import os
+import time
+from datetime import timedelta
+from typing import Optional, Dict, Any, List, Tuple
 from django.contrib.auth import get_user_model
-from django.contrib.auth import authenticate
+from django.contrib.auth.signals import user_login_failed
+from django.db.models import Q
 from django.core.cache import cache
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.mail import send_mail
 import logging
+import threading
 
 # 获取用户模型
 User = get_user_model()
@@ -22,6 +29,153 @@ User = get_user_model()
 # 配置日志
 logger = logging.getLogger(__name__)
 
+# JWT 签名配置（模块加载时解析一次）
+JWT_SECRET_KEY = settings.JWT_SECRET_KEY
+JWT_ALGORITHM = settings.JWT_ALGORITHM
+JWT_ALGORITHMS = (JWT_ALGORITHM,)
+
+# 登录认证时加载的用户字段（包含登录后更新最后登录信息所需的字段）
+AUTHENTICATE_FIELDS = (
+    'id', 'username', 'email', 'phone_number', 'password',
+    'status', 'is_active', 'last_login',
+)
+
+# HMAC 签名算法对应的摘要函数（非 HMAC 算法仍交由 PyJWT 处理）
+_JWT_HMAC_DIGESTS = {
+    'HS256': hashlib.sha256,
+    'HS384': hashlib.sha384,
+    'HS512': hashlib.sha512,
+}
+_JWT_DIGEST = _JWT_HMAC_DIGESTS.get(JWT_ALGORITHM)
+_JWT_KEY = JWT_SECRET_KEY.encode()
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    """Base64URL 编码（去除填充字符）"""
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+# JWT 头部固定不变，预先完成编码
+_JWT_HEADER_B64 = _b64url_encode(
+    json.dumps({'alg': JWT_ALGORITHM, 'typ': 'JWT'}, separators=(',', ':')).encode()
+)
+
+# 预先初始化密钥并写入固定头部的 HMAC 对象，每次签名通过 copy() 复用，
+# 只需追加载荷段即可得到签名，省去密钥填充计算和签名输入的拼接
+_JWT_HMAC = hmac.new(_JWT_KEY, _JWT_HEADER_B64 + b'.', _JWT_DIGEST) if _JWT_DIGEST else None
+
+# 本服务签发的 Token 载荷结构固定，预先生成 JSON 模板（字段顺序与原载荷字典一致）
+_JWT_PAYLOAD_TEMPLATE = b'{"user_id":%d,"token_type":"%s","exp":%d,"iat":%d,"jti":"%s"}'
+
+
+def _sign_jwt(payload_json: bytes) -> str:
+    """
+    使用 HMAC 签名已序列化的 JWT 载荷
+    
+    Args:
+        payload_json: JSON 编码后的 Token 载荷
+        
+    Returns:
+        str: JWT Token 字符串
+    """
+    payload_b64 = _b64url_encode(payload_json)
+    mac = _JWT_HMAC.copy()
+    mac.update(payload_b64)
+    return b'.'.join((_JWT_HEADER_B64, payload_b64, _b64url_encode(mac.digest()))).decode('ascii')
+
+
+def _refresh_token_digest(token: str) -> bytes:
+    """
+    计算刷新令牌的摘要
+    
+    缓存中只保存 16 字节摘要而非完整令牌，减少缓存占用和传输量。
+    
+    Args:
+        token: 刷新令牌
+        
+    Returns:
+        bytes: BLAKE2b 摘要
+    """
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _encode_jwt(payload: Dict[str, Any]) -> str:
+    """
+    编码并签名 JWT
+    
+    HMAC 算法直接拼接预编码的头部并计算签名，生成结果与 PyJWT 一致；
+    其他算法回退到 `jwt.encode`。
+    
+    Args:
+        payload: Token 载荷
+        
+    Returns:
+        str: JWT Token 字符串
+    """
+    if _JWT_DIGEST is None:
+        return jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+    
+    return _sign_jwt(json.dumps(payload, separators=(',', ':')).encode())
+
+
+def _decode_jwt(token: str, require_exp: bool = False) -> Dict[str, Any]:
+    """
+    验证签名并解码 JWT
+    
+    头部与本服务签发的头部一致时，直接校验 HMAC 签名和过期时间；否则回退到
+    `jwt.decode`。失败时抛出与 PyJWT 相同的异常类型。
+    
+    Args:
+        token: JWT Token 字符串
+        require_exp: 是否要求载荷包含过期时间
+        
+    Returns:
+        Dict[str, Any]: Token 载荷
+        
+    Raises:
+        jwt.ExpiredSignatureError: Token 已过期
+        jwt.InvalidTokenError: Token 格式、签名或声明无效
+    """
+    # 定位首尾两个分隔符，避免 split 生成列表和中间对象
+    try:
+        raw = token.encode()
+        header_end = raw.index(b'.')
+        signature_start = raw.rindex(b'.')
+    except (AttributeError, ValueError):
+        raise jwt.DecodeError('Not enough segments')
+    
+    if _JWT_DIGEST is None or raw[:header_end] != _JWT_HEADER_B64:
+        options = {'require': ['exp']} if require_exp else None
+        return jwt.decode(token, JWT_SECRET_KEY, algorithms=JWT_ALGORITHMS, options=options)
+    
+    payload_b64 = raw[header_end + 1:signature_start]
+    if signature_start == header_end or b'.' in payload_b64:
+        raise jwt.DecodeError('Not enough segments')
+    
+    # 常量时间比较签名
+    mac = _JWT_HMAC.copy()
+    mac.update(payload_b64)
+    if not hmac.compare_digest(_b64url_encode(mac.digest()), raw[signature_start + 1:]):
+        raise jwt.InvalidSignatureError('Signature verification failed')
+    
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(payload_b64 + b'=' * (-len(payload_b64) % 4)))
+    except ValueError as e:
+        raise jwt.DecodeError(f'Invalid payload: {e}')
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError('Invalid payload: must be a JSON object')
+    
+    exp = payload.get('exp')
+    if exp is None:
+        if require_exp:
+            raise jwt.MissingRequiredClaimError('exp')
+    elif not isinstance(exp, (int, float)) or isinstance(exp, bool):
+        raise jwt.DecodeError('Expiration Time claim (exp) must be a number')
+    elif exp <= time.time():
+        raise jwt.ExpiredSignatureError('Signature has expired')
+    
+    return payload
+
 
 class AuthService:
     """
@@ -34,6 +188,9 @@ class AuthService:
     ACCESS_TOKEN_TYPE = 'access'
     REFRESH_TOKEN_TYPE = 'refresh'
     
+    # 用户有效状态的缓存时间（秒）
+    USER_ACTIVE_CACHE_TIMEOUT = 60
+    
     @staticmethod
     def generate_tokens(user: User) -> Dict[str, str]:
         """
@@ -47,25 +204,30 @@ class AuthService:
         Returns:
             Dict[str, str]: 包含访问令牌和刷新令牌的字典
         """
+        # 两个令牌共用同一签发时间
+        now_ts = int(time.time())
+        
         # 生成访问令牌
         access_token = AuthService._generate_token(
             user_id=user.id,
             token_type=AuthService.ACCESS_TOKEN_TYPE,
-            expires_delta=timedelta(hours=settings.JWT_EXPIRATION_HOURS)
+            expires_delta=timedelta(hours=settings.JWT_EXPIRATION_HOURS),
+            now_ts=now_ts
         )
         
         # 生成刷新令牌
         refresh_token = AuthService._generate_token(
             user_id=user.id,
             token_type=AuthService.REFRESH_TOKEN_TYPE,
-            expires_delta=timedelta(days=settings.JWT_REFRESH_EXPIRATION_DAYS)
+            expires_delta=timedelta(days=settings.JWT_REFRESH_EXPIRATION_DAYS),
+            now_ts=now_ts
         )
         
-        # 存储刷新令牌到缓存
-        cache_key = f"refresh_token:{user.id}"
-        cache.set(cache_key, refresh_token, timeout=settings.JWT_REFRESH_EXPIRATION_DAYS * 24 * 3600)
+        # 存储刷新令牌摘要到缓存
+        cache_key = f"rt:{user.id}"
+        cache.set(cache_key, _refresh_token_digest(refresh_token), timeout=settings.JWT_REFRESH_EXPIRATION_DAYS * 24 * 3600)
         
-        logger.info(f"用户令牌生成成功: {user.username}")
+        logger.info("用户令牌生成成功: %s", user.username)
         
         return {
             'access_token': access_token,
@@ -76,7 +238,9 @@ class AuthService:
         }
     
     @staticmethod
-    def _generate_token(user_id: int, token_type: str, expires_delta: timedelta) -> str:
+    def _generate_token(
+        user_id: int, token_type: str, expires_delta: timedelta, now_ts: Optional[int] = None
+    ) -> str:
         """
         生成 JWT Token
         
@@ -84,33 +248,35 @@ class AuthService:
             user_id: 用户ID
             token_type: 令牌类型（access 或 refresh）
             expires_delta: 过期时间间隔
+            now_ts: 签发时间（Unix 时间戳，秒），默认为当前时间
             
         Returns:
             str: JWT Token 字符串
         """
-        # 当前时间
-        now = datetime.utcnow()
+        # 当前时间（Unix 时间戳，秒）
+        now = int(time.time()) if now_ts is None else now_ts
+        exp = now + int(expires_delta.total_seconds())
         
-        # 过期时间
-        expire = now + expires_delta
+        # JWT ID，用于防止重放攻击（12 字节随机数编码为 16 个 URL 安全字符，无填充）
+        jti = base64.urlsafe_b64encode(os.urandom(12))
+        
+        # HMAC 算法直接填充载荷模板，省去构造字典和 JSON 序列化
+        if _JWT_HMAC is not None:
+            return _sign_jwt(
+                _JWT_PAYLOAD_TEMPLATE % (user_id, token_type.encode(), exp, now, jti)
+            )
         
         # Token 载荷
         payload = {
             'user_id': user_id,
             'token_type': token_type,
-            'exp': int(expire.timestamp()),
-            'iat': int(now.timestamp()),  # 签发时间
-            'jti': secrets.token_urlsafe(16),  # JWT ID，用于防止重放攻击
+            'exp': exp,
+            'iat': now,  # 签发时间
+            'jti': jti.decode(),
         }
         
         # 生成 Token
-        token = jwt.encode(
-            payload,
-            settings.JWT_SECRET_KEY,
-            algorithm=settings.JWT_ALGORITHM
-        )
-        
-        return token
+        return _encode_jwt(payload)
     
     @staticmethod
     def verify_token(token: str) -> Optional[int]:
@@ -125,17 +291,29 @@ class AuthService:
         Returns:
             Optional[int]: 如果验证成功返回用户ID，失败返回 None
         """
+        result = AuthService.verify_and_decode(token)
+        return result[0] if result else None
+    
+    @staticmethod
+    def verify_and_decode(token: str) -> Optional[Tuple[int, int]]:
+        """
+        验证 JWT Token 并返回用户ID和过期时间
+        
+        只解码一次 Token，同时完成签名、过期时间、类型和用户状态的校验。
+        
+        Args:
+            token: JWT Token 字符串
+            
+        Returns:
+            Optional[Tuple[int, int]]: 如果验证成功返回 `(user_id, exp)`，失败返回 None
+        """
         try:
-            # 解码 Token
-            payload = jwt.decode(
-                token,
-                settings.JWT_SECRET_KEY,
-                algorithms=[settings.JWT_ALGORITHM]
-            )
+            # 解码 Token（要求包含过期时间）
+            payload = _decode_jwt(token, require_exp=True)
             
             # 验证 Token 类型
             if payload.get('token_type') != AuthService.ACCESS_TOKEN_TYPE:
-                logger.warning(f"Token 类型错误: {payload.get('token_type')}")
+                logger.warning("Token 类型错误: %s", payload.get('token_type'))
                 return None
             
             # 获取用户ID
@@ -145,23 +323,61 @@ class AuthService:
                 return None
             
             # 检查用户是否存在且有效
-            try:
-                user = User.objects.get(id=user_id, is_deleted=False, status='active')
-                return user_id
-            except User.DoesNotExist:
-                logger.warning(f"Token 对应的用户不存在或无效: {user_id}")
+            if not AuthService.is_user_active(user_id):
+                logger.warning("Token 对应的用户不存在或无效: %s", user_id)
                 return None
+            return user_id, payload['exp']
                 
         except jwt.ExpiredSignatureError:
             logger.warning("Token 已过期")
             return None
         except jwt.InvalidTokenError as e:
-            logger.warning(f"Token 验证失败: {e}")
+            logger.warning("Token 验证失败: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Token 验证异常: {e}")
+            logger.error("Token 验证异常: %s", e)
             return None
     
+    @staticmethod
+    def is_user_active(user_id: int) -> bool:
+        """
+        检查用户是否存在且有效
+        
+        结果缓存 `USER_ACTIVE_CACHE_TIMEOUT` 秒，用户保存或删除时由信号清除。
+        
+        Args:
+            user_id: 用户ID
+            
+        Returns:
+            bool: 用户未删除且状态为活跃时返回 True
+        """
+        cache_key = f"ua:{user_id}"
+        flag = cache.get(cache_key)
+        if flag is None:
+            flag = 1 if User.active.filter(id=user_id, status='active').exists() else 0
+            cache.set(cache_key, flag, timeout=AuthService.USER_ACTIVE_CACHE_TIMEOUT)
+        return flag == 1
+    
+    @staticmethod
+    def invalidate_user_active(user_id: int) -> None:
+        """
+        清除用户有效状态缓存
+        
+        Args:
+            user_id: 用户ID
+        """
+        cache.delete(f"ua:{user_id}")
+    
+    @staticmethod
+    def invalidate_users_active(user_ids: List[int]) -> None:
+        """
+        批量清除用户有效状态缓存
+        
+        Args:
+            user_ids: 用户ID列表
+        """
+        cache.delete_many([f"ua:{user_id}" for user_id in user_ids])
+    
     @staticmethod
     def refresh_access_token(refresh_token: str) -> Optional[Dict[str, str]]:
         """
@@ -177,15 +393,11 @@ class AuthService:
         """
         try:
             # 验证刷新令牌
-            payload = jwt.decode(
-                refresh_token,
-                settings.JWT_SECRET_KEY,
-                algorithms=[settings.JWT_ALGORITHM]
-            )
+            payload = _decode_jwt(refresh_token)
             
             # 验证 Token 类型
             if payload.get('token_type') != AuthService.REFRESH_TOKEN_TYPE:
-                logger.warning(f"刷新令牌类型错误: {payload.get('token_type')}")
+                logger.warning("刷新令牌类型错误: %s", payload.get('token_type'))
                 return None
             
             # 获取用户ID
@@ -194,18 +406,21 @@ class AuthService:
                 logger.warning("刷新令牌中缺少用户ID")
                 return None
             
-            # 检查用户是否存在且有效
-            try:
-                user = User.objects.get(id=user_id, is_deleted=False, status='active')
-            except User.DoesNotExist:
-                logger.warning(f"刷新令牌对应的用户不存在: {user_id}")
+            # 先验证缓存中的刷新令牌，已登出或被替换的令牌无需查询数据库
+            cache_key = f"rt:{user_id}"
+            cached_digest = cache.get(cache_key)
+            if not cached_digest or not hmac.compare_digest(
+                cached_digest, _refresh_token_digest(refresh_token)
+            ):
+                logger.warning("刷新令牌无效或已过期: %s", user_id)
                 return None
             
-            # 验证缓存中的刷新令牌
-            cache_key = f"refresh_token:{user_id}"
-            cached_token = cache.get(cache_key)
-            if not cached_token or cached_token != refresh_token:
-                logger.warning(f"刷新令牌无效或已过期: {user_id}")
+            # 检查用户是否存在且有效（仅查询日志所需的用户名）
+            username = User.active.filter(
+                id=user_id, status='active'
+            ).values_list('username', flat=True).first()
+            if username is None:
+                logger.warning("刷新令牌对应的用户不存在: %s", user_id)
                 return None
             
             # 生成新的访问令牌
@@ -215,7 +430,7 @@ class AuthService:
                 expires_delta=timedelta(hours=settings.JWT_EXPIRATION_HOURS)
             )
             
-            logger.info(f"访问令牌刷新成功: {user.username}")
+            logger.info("访问令牌刷新成功: %s", username)
             
             return {
                 'access_token': new_access_token,
@@ -227,10 +442,10 @@ class AuthService:
             logger.warning("刷新令牌已过期")
             return None
         except jwt.InvalidTokenError as e:
-            logger.warning(f"刷新令牌验证失败: {e}")
+            logger.warning("刷新令牌验证失败: %s", e)
             return None
         except Exception as e:
-            logger.error(f"刷新访问令牌异常: {e}")
+            logger.error("刷新访问令牌异常: %s", e)
             return None
     
     @staticmethod
@@ -247,37 +462,45 @@ class AuthService:
         Returns:
             Optional[User]: 如果认证成功返回用户实例，失败返回 None
         """
-        # 尝试不同的登录方式
-        user = None
-        
-        # 1. 用户名登录
-        user = authenticate(username=username, password=password)
-        
-        # 2. 邮箱登录
-        if not user:
-            try:
-                user_obj = User.objects.get(email=username, is_deleted=False)
-                user = authenticate(username=user_obj.username, password=password)
-            except User.DoesNotExist:
-                pass
+        # 一次查询匹配用户名、邮箱或手机号，按 用户名 > 邮箱 > 手机号 的优先级排列候选用户
+        candidates = list(
+            User.objects.filter(
+                Q(username=username) | Q(email=username, is_deleted=False) |
+                Q(phone_number=username, is_deleted=False)
+            ).only(*AUTHENTICATE_FIELDS)[:3]
+        )
+        ordered = []
+        for field in ('username', 'email', 'phone_number'):
+            for candidate in candidates:
+                if getattr(candidate, field) == username and candidate not in ordered:
+                    ordered.append(candidate)
+        
+        # 依次校验候选用户的密码，优先匹配的用户密码不符时回退到下一个（与逐一调用
+        # authenticate() 一致），通常只做一次哈希校验；用户不存在时同样执行一次哈希，
+        # 避免通过响应时间探测账号
+        user = next(
+            (candidate for candidate in ordered if candidate.check_password(password) and candidate.is_active),
+            None
+        )
+        if not ordered:
+            User().set_password(password)
         
-        # 3. 手机号登录
-        if not user:
-            try:
-                user_obj = User.objects.get(phone_number=username, is_deleted=False)
-                user = authenticate(username=user_obj.username, password=password)
-            except User.DoesNotExist:
-                pass
+        if user is None:
+            # 与 authenticate() 一致，发送登录失败信号供审计和锁定处理
+            user_login_failed.send(sender=__name__, credentials={'username': username}, request=None)
+        else:
+            # 与 authenticate() 一致，标记认证后端供 Django 会话登录使用
+            user.backend = settings.AUTHENTICATION_BACKENDS[0]
         
         # 检查用户状态
         if user and user.status != 'active':
-            logger.warning(f"用户账户状态异常: {username} - {user.status}")
+            logger.warning("用户账户状态异常: %s - %s", username, user.status)
             return None
         
         if user:
-            logger.info(f"用户认证成功: {username}")
+            logger.info("用户认证成功: %s", username)
         else:
-            logger.warning(f"用户认证失败: {username}")
+            logger.warning("用户认证失败: %s", username)
         
         return user
     
@@ -296,33 +519,34 @@ class AuthService:
             bool: 登出成功返回 True
         """
         try:
-            # 清除缓存中的刷新令牌
-            cache_key = f"refresh_token:{user_id}"
-            cache.delete(cache_key)
+            cache_key = f"rt:{user_id}"
             
-            # 如果提供了刷新令牌，也可以将其加入黑名单
+            # 如果提供了刷新令牌，将其加入黑名单
+            blacklist_key = None
+            expire_time = 0
             if refresh_token:
                 try:
-                    payload = jwt.decode(
-                        refresh_token,
-                        settings.JWT_SECRET_KEY,
-                        algorithms=[settings.JWT_ALGORITHM]
-                    )
+                    payload = _decode_jwt(refresh_token)
                     jti = payload.get('jti')
                     if jti:
-                        # 将 Token ID 加入黑名单
                         blacklist_key = f"blacklist_token:{jti}"
-                        expire_time = payload.get('exp', 0) - int(datetime.utcnow().timestamp())
-                        if expire_time > 0:
-                            cache.set(blacklist_key, True, timeout=expire_time)
+                        expire_time = payload.get('exp', 0) - int(time.time())
                 except Exception:
                     pass  # 忽略刷新令牌处理错误
             
-            logger.info(f"用户登出成功: {user_id}")
+            if blacklist_key and expire_time > 0:
+                # 在同一次缓存写入中将 Token ID 加入黑名单，并以空值覆盖缓存中的刷新令牌摘要
+                # （空值与缺失同样视为无效），Redis 后端通过 pipeline 一次往返完成
+                cache.set_many({cache_key: b'', blacklist_key: True}, timeout=expire_time)
+            else:
+                # 清除缓存中的刷新令牌
+                cache.delete(cache_key)
+            
+            logger.info("用户登出成功: %s", user_id)
             return True
             
         except Exception as e:
-            logger.error(f"用户登出失败: {e}")
+            logger.error("用户登出失败: %s", e)
             return False
     
     @staticmethod
@@ -372,9 +596,64 @@ class AuthService:
         cache_key = f"password_reset:{user.id}"
         cache.set(cache_key, reset_token, timeout=12 * 3600)  # 12小时过期
         
-        logger.info(f"密码重置令牌生成成功: {user.username}")
+        logger.info("密码重置令牌生成成功: %s", user.username)
         return reset_token
     
+    @staticmethod
+    def send_password_reset_email(email: str, reset_url: str) -> None:
+        """
+        发送密码重置邮件
+        
+        同步发送邮件，发送失败只记录日志，不向调用方抛出异常。
+        
+        Args:
+            email: 收件人邮箱
+            reset_url: 密码重置链接
+        """
+        try:
+            send_mail(
+                subject='密码重置请求',
+                message=f'请点击以下链接重置您的密码：{reset_url}',
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                recipient_list=[email],
+                fail_silently=True,
+            )
+            logger.info("密码重置邮件发送成功: %s", email)
+        except Exception as e:
+            logger.error("密码重置邮件发送失败: %s", e)
+    
+    @staticmethod
+    def send_password_reset(user: User, base_url: str) -> None:
+        """
+        签发密码重置令牌并发送重置邮件
+        
+        Args:
+            user: 用户实例（需包含 id、username、email 字段）
+            base_url: 站点根地址，以 `/` 结尾
+        """
+        reset_token = AuthService.generate_password_reset_token(user)
+        reset_url = f"{base_url}auth/password/reset/confirm?token={reset_token}"
+        AuthService.send_password_reset_email(user.email, reset_url)
+    
+    @staticmethod
+    def enqueue_password_reset(user: User, base_url: str) -> None:
+        """
+        异步处理密码重置请求
+        
+        在后台守护线程中签发重置令牌、写入缓存并发送邮件，请求线程无需等待
+        令牌签发、缓存写入和 SMTP 交互完成。
+        
+        Args:
+            user: 用户实例（需包含 id、username、email 字段）
+            base_url: 站点根地址，以 `/` 结尾
+        """
+        threading.Thread(
+            target=AuthService.send_password_reset,
+            args=(user, base_url),
+            name='password-reset',
+            daemon=True,
+        ).start()
+    
     @staticmethod
     def verify_password_reset_token(token: str) -> Optional[User]:
         """
@@ -390,15 +669,11 @@ class AuthService:
         """
         try:
             # 验证令牌
-            payload = jwt.decode(
-                token,
-                settings.JWT_SECRET_KEY,
-                algorithms=[settings.JWT_ALGORITHM]
-            )
+            payload = _decode_jwt(token)
             
             # 验证 Token 类型
             if payload.get('token_type') != 'reset':
-                logger.warning(f"重置令牌类型错误: {payload.get('token_type')}")
+                logger.warning("重置令牌类型错误: %s", payload.get('token_type'))
                 return None
             
             # 获取用户ID
@@ -407,22 +682,22 @@ class AuthService:
                 logger.warning("重置令牌中缺少用户ID")
                 return None
             
-            # 检查用户是否存在
+            # 检查用户是否存在（加载的字段覆盖重置密码及其保存信号所需的字段）
             try:
-                user = User.objects.get(id=user_id, is_deleted=False)
+                user = User.active.only(*AUTHENTICATE_FIELDS).get(pk=user_id)
                 return user
             except User.DoesNotExist:
-                logger.warning(f"重置令牌对应的用户不存在: {user_id}")
+                logger.warning("重置令牌对应的用户不存在: %s", user_id)
                 return None
                 
         except jwt.ExpiredSignatureError:
             logger.warning("重置令牌已过期")
             return None
         except jwt.InvalidTokenError as e:
-            logger.warning(f"重置令牌验证失败: {e}")
+            logger.warning("重置令牌验证失败: %s", e)
             return None
         except Exception as e:
-            logger.error(f"重置令牌验证异常: {e}")
+            logger.error("重置令牌验证异常: %s", e)
             return None
     
     @staticmethod
@@ -453,9 +728,9 @@ class AuthService:
             cache_key = f"password_reset:{user.id}"
             cache.delete(cache_key)
             
-            logger.info(f"用户密码重置成功: {user.username}")
+            logger.info("用户密码重置成功: %s", user.username)
             return True
             
         except Exception as e:
-            logger.error(f"用户密码重置失败: {e}")
+            logger.error("用户密码重置失败: %s", e)
             return False
\ No newline at end of file
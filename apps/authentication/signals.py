@@ -5,18 +5,24 @@
 """
 
 from django.contrib.auth.signals import user_logged_in, user_logged_out, user_login_failed
-from django.db.models.signals import pre_save
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 from django.conf import settings
 import logging
 
+# 导入服务
+from .services import AuthService
+
 # 获取用户模型
 User = get_user_model()
 
 # 配置日志
 logger = logging.getLogger(__name__)
 
+# 影响 Token 校验结果的用户字段
+USER_ACTIVE_FIELDS = frozenset({'status', 'is_deleted'})
+
 
 @receiver(user_logged_in)
 def user_logged_in_handler(sender, request, user, **kwargs):
@@ -35,7 +41,7 @@ def user_logged_in_handler(sender, request, user, **kwargs):
     ip_address = request.META.get('REMOTE_ADDR') if request else '未知'
     user.update_last_login_info(ip_address)
     
-    logger.info(f"用户登录成功: {user.username} (IP: {ip_address})")
+    logger.info("用户登录成功: %s (IP: %s)", user.username, ip_address)
     
     # 可以在这里添加登录统计、发送通知等操作
 
@@ -53,7 +59,7 @@ def user_logged_out_handler(sender, request, user, **kwargs):
         user: 登出的用户实例
         kwargs: 其他参数
     """
-    logger.info(f"用户登出成功: {user.username if user else '匿名用户'}")
+    logger.info("用户登出成功: %s", user.username if user else '匿名用户')
     
     # 可以在这里添加登出清理操作
 
@@ -74,14 +80,14 @@ def user_login_failed_handler(sender, credentials, request, **kwargs):
     username = credentials.get('username', '未知用户')
     ip_address = request.META.get('REMOTE_ADDR') if request else '未知'
     
-    logger.warning(f"用户登录失败: {username} (IP: {ip_address})")
+    logger.warning("用户登录失败: %s (IP: %s)", username, ip_address)
     
     # 可以在这里添加登录失败统计、安全告警等操作
     # 例如：记录失败次数，达到一定次数后锁定账户
 
 
 @receiver(pre_save, sender=User)
-def password_change_handler(sender, instance, **kwargs):
+def password_change_handler(sender, instance, update_fields=None, **kwargs):
     """
     密码修改信号处理器
     
@@ -90,21 +96,55 @@ def password_change_handler(sender, instance, **kwargs):
     Args:
         sender: 发送信号的模型类
         instance: 用户实例
+        update_fields: 本次保存更新的字段（全部保存时为 None）
+        kwargs: 其他参数
+    """
+    if not instance.pk:
+        return
+    
+    # 本次保存不涉及密码字段时无需比较
+    if update_fields is not None and 'password' not in update_fields:
+        return
+    
+    # 只查询密码字段
+    old_password = User.objects.filter(pk=instance.pk).values_list('password', flat=True).first()
+    
+    # 检查密码是否变更
+    if old_password is not None and old_password != instance.password:
+        logger.info("用户密码修改: %s", instance.username)
+        
+        # 可以在这里添加密码修改通知等操作
+        # 例如：发送邮件通知用户密码已修改
+
+
+@receiver(post_save, sender=User)
+def user_active_cache_handler(sender, instance, update_fields=None, **kwargs):
+    """
+    用户状态缓存清除处理器
+    
+    用户保存时，如果可能修改了状态或删除标记，则清除 Token 校验使用的用户有效状态缓存。
+    
+    Args:
+        sender: 发送信号的模型类
+        instance: 用户实例
+        update_fields: 本次保存更新的字段（全部保存时为 None）
+        kwargs: 其他参数
+    """
+    if update_fields is None or USER_ACTIVE_FIELDS & set(update_fields):
+        AuthService.invalidate_user_active(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def user_deleted_cache_handler(sender, instance, **kwargs):
+    """
+    用户删除缓存清除处理器
+    
+    Args:
+        sender: 发送信号的模型类
+        instance: 被删除的用户实例
         kwargs: 其他参数
     """
-    if instance.pk:
-        try:
-            old_user = User.objects.get(pk=instance.pk)
-            
-            # 检查密码是否变更
-            if old_user.password != instance.password:
-                logger.info(f"用户密码修改: {instance.username}")
-                
-                # 可以在这里添加密码修改通知等操作
-                # 例如：发送邮件通知用户密码已修改
-                
-        except User.DoesNotExist:
-            pass
+    AuthService.invalidate_user_active(instance.pk)
 
 
 # 连接信号
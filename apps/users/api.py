@@ -7,6 +7,7 @@
 from ninja import Router
 from ninja import Query
 from ninja.pagination import paginate
+from ninja.errors import HttpError
 from django.contrib.auth import get_user_model
 from django.db.models import Q
 from django.core.exceptions import ValidationError
@@ -14,16 +15,19 @@ from typing import List, Optional
 import logging
 
 # 导入认证类
-from apps.api.api import AuthBearer
+from apps.api.auth import AUTH_BEARER, ASYNC_AUTH_BEARER, token_cache
+
+# 导入分页器
+from apps.api.pagination import EstimatedCountPagination
 
 # 导入服务
 from .services import UserService, UserProfileService
 
 # 导入模式
 from .schemas import (
-    UserCreate, UserUpdate, UserResponse, UserListResponse,
+    UserCreate, UserUpdate, UserResponse,
     UserPasswordUpdate, UserDetailResponse, UserFilter,
-    UserProfileUpdate, UserProfileResponse
+    UserProfileUpdate, UserProfileResponse, UserBulkRequest
 )
 
 # 获取用户模型
@@ -35,6 +39,58 @@ router = Router()
 # 配置日志
 logger = logging.getLogger(__name__)
 
+# 用户列表只读取 UserResponse 需要的字段
+USER_LIST_FIELDS = (
+    'id', 'username', 'email', 'nickname', 'phone_number', 'user_type', 'status',
+    'email_verified', 'phone_verified', 'avatar', 'bio', 'last_login', 'created_at', 'updated_at',
+)
+
+# 修改密码所需的用户字段（包含密码相似度校验和保存信号会读取的字段）
+PASSWORD_UPDATE_FIELDS = (
+    'id', 'password', 'username', 'email',
+    'first_name', 'last_name', 'phone_number',
+)
+
+# 具有管理员权限的用户类型
+ADMIN_USER_TYPES = ('admin', 'superuser')
+
+
+def _current_user_id(request) -> int:
+    """
+    获取当前认证用户的 ID
+    
+    Args:
+        request: Django 请求对象
+        
+    Returns:
+        int: 认证中间件写入的用户 ID
+        
+    Raises:
+        ValidationError: 当请求未认证时抛出
+    """
+    user_id = getattr(request, 'user_id', None)
+    if not user_id:
+        raise ValidationError("用户未认证")
+    return user_id
+
+
+def _require_admin(request) -> None:
+    """
+    校验当前认证用户是否为管理员
+    
+    Args:
+        request: Django 请求对象
+        
+    Raises:
+        HttpError: 当前用户不是管理员时抛出（403）
+    """
+    is_admin = User.active.filter(
+        Q(is_staff=True) | Q(user_type__in=ADMIN_USER_TYPES),
+        pk=_current_user_id(request),
+    ).exists()
+    if not is_admin:
+        raise HttpError(403, "权限不足")
+
 
 @router.post("/register", response=UserResponse, auth=None)
 def register_user(request, user_data: UserCreate):
@@ -51,26 +107,22 @@ def register_user(request, user_data: UserCreate):
         UserResponse: 新创建的用户信息
         
     Raises:
-        ValidationError: 当数据验证失败时抛出
+        HttpError: 当数据验证失败时抛出（422）
     """
     try:
         # 创建用户
-        user = UserService.create_user(user_data.dict())
+        user = UserService.create_user(user_data)
         return user
     except ValidationError as e:
-        logger.error(f"用户注册失败: {e}")
-        # 返回422验证错误响应
-        from django.http import JsonResponse
-        return JsonResponse(
-            {"detail": list(e.messages) if hasattr(e, 'messages') else [str(e)]},
-            status=422
-        )
+        logger.error("用户注册失败: %s", e)
+        # 返回422验证错误响应（HttpError 的消息必须为字符串，多条错误合并返回）
+        raise HttpError(422, "; ".join(e.messages))
     except Exception as e:
-        logger.error(f"用户注册失败: {e}")
+        logger.error("用户注册失败: %s", e)
         raise
 
 
-@router.get("/me", response=UserDetailResponse, auth=AuthBearer())
+@router.get("/me", response=UserDetailResponse, auth=AUTH_BEARER)
 def get_current_user(request):
     """
     获取当前用户信息
@@ -84,12 +136,10 @@ def get_current_user(request):
         UserDetailResponse: 当前用户的详细信息
     """
     # 获取当前用户（通过认证中间件）
-    user_id = getattr(request, 'user_id', None)
-    if not user_id:
-        raise ValidationError("用户未认证")
+    user_id = _current_user_id(request)
     
     try:
-        user = User.objects.get(id=user_id, is_deleted=False)
+        user = UserService.get_cached_user(user_id)
         profile = UserProfileService.get_profile(user)
         
         return UserDetailResponse(
@@ -100,7 +150,7 @@ def get_current_user(request):
         raise ValidationError("用户不存在")
 
 
-@router.put("/me", response=UserResponse, auth=AuthBearer())
+@router.put("/me", response=UserResponse, auth=AUTH_BEARER)
 def update_current_user(request, user_data: UserUpdate):
     """
     更新当前用户信息
@@ -115,27 +165,25 @@ def update_current_user(request, user_data: UserUpdate):
         UserResponse: 更新后的用户信息
     """
     # 获取当前用户
-    user_id = getattr(request, 'user_id', None)
-    if not user_id:
-        raise ValidationError("用户未认证")
+    user_id = _current_user_id(request)
     
     try:
-        user = User.objects.get(id=user_id, is_deleted=False)
-        updated_user = UserService.update_user(user, user_data.dict(exclude_unset=True))
+        user = User.active.get(pk=user_id)
+        updated_user = UserService.update_user(user, user_data.model_dump(exclude_unset=True))
         return updated_user
     except User.DoesNotExist:
         raise ValidationError("用户不存在")
     except ValidationError as e:
-        logger.error(f"用户信息更新失败: {e}")
+        logger.error("用户信息更新失败: %s", e)
         raise
 
 
-@router.put("/me/password", response=dict, auth=AuthBearer())
-def update_current_user_password(request, password_data: UserPasswordUpdate):
+@router.put("/me/password", response=dict, auth=ASYNC_AUTH_BEARER)
+async def update_current_user_password(request, password_data: UserPasswordUpdate):
     """
     更新当前用户密码
     
-    更新当前认证用户的登录密码。
+    更新当前认证用户的登录密码。密码哈希在线程池中计算，不阻塞事件循环。
     
     Args:
         request: Django 请求对象
@@ -145,31 +193,25 @@ def update_current_user_password(request, password_data: UserPasswordUpdate):
         dict: 操作结果消息
     """
     # 获取当前用户
-    user_id = getattr(request, 'user_id', None)
-    if not user_id:
-        raise ValidationError("用户未认证")
+    user_id = _current_user_id(request)
     
     try:
-        user = User.objects.get(id=user_id, is_deleted=False)
-        success = UserService.update_password(
+        user = await User.active.only(*PASSWORD_UPDATE_FIELDS).aget(pk=user_id)
+        await UserService.aupdate_password(
             user, 
             password_data.old_password,
             password_data.new_password
         )
-        
-        if success:
-            return {"message": "密码更新成功"}
-        else:
-            raise ValidationError("密码更新失败")
+        return {"message": "密码更新成功"}
             
     except User.DoesNotExist:
         raise ValidationError("用户不存在")
     except ValidationError as e:
-        logger.error(f"密码更新失败: {e}")
+        logger.error("密码更新失败: %s", e)
         raise
 
 
-@router.get("/me/profile", response=UserProfileResponse, auth=AuthBearer())
+@router.get("/me/profile", response=UserProfileResponse, auth=AUTH_BEARER)
 def get_current_user_profile(request):
     """
     获取当前用户资料
@@ -183,19 +225,17 @@ def get_current_user_profile(request):
         UserProfileResponse: 用户资料信息
     """
     # 获取当前用户
-    user_id = getattr(request, 'user_id', None)
-    if not user_id:
-        raise ValidationError("用户未认证")
+    user_id = _current_user_id(request)
     
     try:
-        user = User.objects.get(id=user_id, is_deleted=False)
+        user = UserService.get_cached_user(user_id)
         profile = UserProfileService.get_profile(user)
         return profile
     except User.DoesNotExist:
         raise ValidationError("用户不存在")
 
 
-@router.put("/me/profile", response=UserProfileResponse, auth=AuthBearer())
+@router.put("/me/profile", response=UserProfileResponse, auth=AUTH_BEARER)
 def update_current_user_profile(request, profile_data: UserProfileUpdate):
     """
     更新当前用户资料
@@ -210,22 +250,20 @@ def update_current_user_profile(request, profile_data: UserProfileUpdate):
         UserProfileResponse: 更新后的用户资料
     """
     # 获取当前用户
-    user_id = getattr(request, 'user_id', None)
-    if not user_id:
-        raise ValidationError("用户未认证")
+    user_id = _current_user_id(request)
     
     try:
-        user = User.objects.get(id=user_id, is_deleted=False)
-        profile = UserProfileService.update_profile(user, profile_data.dict(exclude_unset=True))
+        user = User.active.select_related('profile').get(pk=user_id)
+        profile = UserProfileService.update_profile(user, profile_data.model_dump(exclude_unset=True))
         return profile
     except User.DoesNotExist:
         raise ValidationError("用户不存在")
     except ValidationError as e:
-        logger.error(f"用户资料更新失败: {e}")
+        logger.error("用户资料更新失败: %s", e)
         raise
 
 
-@router.delete("/me", response=dict, auth=AuthBearer())
+@router.delete("/me", response=dict, auth=AUTH_BEARER)
 def delete_current_user(request):
     """
     删除当前用户（软删除）
@@ -239,26 +277,21 @@ def delete_current_user(request):
         dict: 操作结果消息
     """
     # 获取当前用户
-    user_id = getattr(request, 'user_id', None)
-    if not user_id:
-        raise ValidationError("用户未认证")
+    user_id = _current_user_id(request)
     
-    try:
-        user = User.objects.get(id=user_id, is_deleted=False)
-        success = UserService.soft_delete_user(user)
-        
-        if success:
-            return {"message": "账户删除成功"}
-        else:
-            raise ValidationError("账户删除失败")
-            
-    except User.DoesNotExist:
+    # 直接更新删除标记，无需先加载用户
+    if not UserService.soft_delete_user_by_id(user_id):
         raise ValidationError("用户不存在")
+    
+    # 移除当前 Token 的验证缓存，删除后立即拒绝该 Token
+    token_cache.discard(request.auth_token)
+    
+    return {"message": "账户删除成功"}
 
 
 # 管理员接口（需要特殊权限）
 @router.get("/", response=List[UserResponse])
-@paginate  # 分页支持
+@paginate(EstimatedCountPagination)  # 分页支持（无过滤条件时使用估算总数）
 def list_users(request, filters: UserFilter = Query(...)):
     """
     获取用户列表（管理员功能）
@@ -270,60 +303,65 @@ def list_users(request, filters: UserFilter = Query(...)):
         filters: 用户过滤条件
         
     Returns:
-        List[UserResponse]: 用户列表响应
+        QuerySet: 过滤后的用户查询集，由分页器在数据库层应用 LIMIT/OFFSET
     """
     # 这里应该添加管理员权限检查
     # if not request.user.is_staff:
     #     raise ValidationError("权限不足")
     
-    # 构建查询
-    queryset = User.objects.filter(is_deleted=False)
-    
-    # 应用过滤条件
-    if filters.username:
-        queryset = queryset.filter(username__icontains=filters.username)
-    
-    if filters.email:
-        queryset = queryset.filter(email__icontains=filters.email)
-    
-    if filters.nickname:
-        queryset = queryset.filter(nickname__icontains=filters.nickname)
-    
-    if filters.user_type:
-        queryset = queryset.filter(user_type=filters.user_type)
-    
-    if filters.status:
-        queryset = queryset.filter(status=filters.status)
-    
-    if filters.email_verified is not None:
-        queryset = queryset.filter(email_verified=filters.email_verified)
-    
-    if filters.phone_verified is not None:
-        queryset = queryset.filter(phone_verified=filters.phone_verified)
-    
-    if filters.created_at_start:
-        queryset = queryset.filter(created_at__gte=filters.created_at_start)
-    
-    if filters.created_at_end:
-        queryset = queryset.filter(created_at__lte=filters.created_at_end)
+    # 由过滤模式一次构建全部过滤条件（忽略未提供的条件）
+    filter_q = filters.get_filter_expression()
+    queryset = User.active.filter(filter_q).only(*USER_LIST_FIELDS)
+    
+    # 无过滤条件时总数即全部用户数，使用缓存的估算值代替 COUNT(*)
+    if not filter_q and not filters.cursor:
+        request.estimated_count = UserService.estimate_active_user_count()
+    
+    # 游标分页：从上一页最后一个用户之后继续查询，避免深分页时的大 OFFSET 扫描
+    if filters.cursor:
+        cursor_created_at = User.objects.filter(id=filters.cursor).values_list(
+            'created_at', flat=True
+        ).first()
+        if cursor_created_at is not None:
+            queryset = queryset.filter(
+                Q(created_at__lt=cursor_created_at) |
+                Q(created_at=cursor_created_at, id__lt=filters.cursor)
+            )
+    
+    # 排序（以 ID 作为次级排序保证顺序稳定）
+    queryset = queryset.order_by('-created_at', '-id')
+    
+    # 返回惰性查询集，由分页器在数据库层完成切片
+    return queryset
+
+
+@router.post("/bulk", response=List[UserDetailResponse], auth=AUTH_BEARER)
+def bulk_user_detail(request, payload: UserBulkRequest):
+    """
+    批量获取用户详情（管理员功能）
     
-    # 排序
-    queryset = queryset.order_by('-created_at')
+    使用 `in_bulk` 以一条 `WHERE id IN (...)` 查询取回全部用户及资料，
+    代替逐个调用用户详情接口的 N 次查询。
     
-    # 获取总数
-    total = queryset.count()
+    Args:
+        request: Django 请求对象
+        payload: 用户ID列表
+        
+    Returns:
+        List[UserDetailResponse]: 按请求顺序排列的用户详情（忽略不存在的用户）
+        
+    Raises:
+        HttpError: 当前用户不是管理员时抛出（403）
+    """
+    _require_admin(request)
     
-    # 这里应该返回分页后的数据
-    # 为了简化，这里返回所有数据
-    users = list(queryset)
+    users = User.active.select_related('profile').defer('metadata', 'password').in_bulk(payload.ids)
     
-    return UserListResponse(
-        items=users,
-        total=total,
-        page=1,  # 应该根据实际分页参数设置
-        page_size=len(users),
-        total_pages=1  # 应该根据实际分页计算
-    )
+    return [
+        UserDetailResponse(user=user, profile=getattr(user, 'profile', None))
+        for user in map(users.get, dict.fromkeys(payload.ids))
+        if user is not None
+    ]
 
 
 @router.get("/{user_id}", response=UserDetailResponse)
@@ -343,7 +381,7 @@ def get_user_detail(request, user_id: int):
     # 这里应该添加管理员权限检查
     
     try:
-        user = User.objects.get(id=user_id, is_deleted=False)
+        user = UserService.get_cached_user(user_id)
         profile = UserProfileService.get_profile(user)
         
         return UserDetailResponse(
@@ -372,13 +410,13 @@ def update_user(request, user_id: int, user_data: UserUpdate):
     # 这里应该添加管理员权限检查
     
     try:
-        user = User.objects.get(id=user_id, is_deleted=False)
-        updated_user = UserService.update_user(user, user_data.dict(exclude_unset=True))
+        user = User.active.get(pk=user_id)
+        updated_user = UserService.update_user(user, user_data.model_dump(exclude_unset=True))
         return updated_user
     except User.DoesNotExist:
         raise ValidationError("用户不存在")
     except ValidationError as e:
-        logger.error(f"用户信息更新失败: {e}")
+        logger.error("用户信息更新失败: %s", e)
         raise
 
 
@@ -398,14 +436,8 @@ def delete_user(request, user_id: int):
     """
     # 这里应该添加管理员权限检查
     
-    try:
-        user = User.objects.get(id=user_id, is_deleted=False)
-        success = UserService.soft_delete_user(user)
-        
-        if success:
-            return {"message": "用户删除成功"}
-        else:
-            raise ValidationError("用户删除失败")
-            
-    except User.DoesNotExist:
-        raise ValidationError("用户不存在")
\ No newline at end of file
+    # 直接更新删除标记，无需先加载用户
+    if not UserService.soft_delete_user_by_id(user_id):
+        raise ValidationError("用户不存在")
+    
+    return {"message": "用户删除成功"}
\ No newline at end of file
@@ -25,5 +25,11 @@ class UsersConfig(AppConfig):
         
         当 Django 启动时会调用此方法，可以在这里进行信号注册等操作。
         """
+        from django.db.models.signals import post_migrate
+        
         # 导入信号处理器
-        from . import signals
\ No newline at end of file
+        from . import signals
+        
+        # 迁移完成后创建数据库相关索引
+        post_migrate.connect(signals.trigram_index_handler, sender=self)
+        post_migrate.connect(signals.brin_index_handler, sender=self)
\ No newline at end of file
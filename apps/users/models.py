@@ -5,9 +5,39 @@
 """
 
 from django.contrib.auth.models import AbstractUser
+from django.conf import settings
 from django.db import models
 from django.utils import timezone
 from django.core.validators import RegexValidator
+import re
+
+
+# 手机号格式（模型校验器和接口模式共用）
+PHONE_PATTERN = r'^1[3-9]\d{9}$'
+
+# 预编译的手机号正则及共享校验器
+PHONE_RE = re.compile(PHONE_PATTERN)
+PHONE_VALIDATOR = RegexValidator(regex=PHONE_RE, message='请输入有效的手机号码')
+
+# 变更后需要重新验证的联系方式字段
+CONTACT_FIELDS = ('email', 'phone_number')
+
+
+class ActiveUserManager(models.Manager):
+    """
+    未删除用户管理器
+    
+    查询集默认排除已软删除的用户。
+    """
+    
+    def get_queryset(self):
+        """
+        获取查询集
+        
+        Returns:
+            QuerySet: 仅包含未删除用户的查询集
+        """
+        return super().get_queryset().filter(is_deleted=False)
 
 
 class User(AbstractUser):
@@ -66,10 +96,7 @@ class User(AbstractUser):
     )
     
     # 手机号
-    phone_regex = RegexValidator(
-        regex=r'^1[3-9]\d{9}$',
-        message='请输入有效的手机号码'
-    )
+    phone_regex = PHONE_VALIDATOR
     phone_number = models.CharField(
         verbose_name='手机号码',
         validators=[phone_regex],
@@ -154,6 +181,7 @@ class User(AbstractUser):
     is_deleted = models.BooleanField(
         verbose_name='已删除',
         default=False,
+        db_index=True,
         help_text='软删除标记，标记为删除的用户不会真正删除'
     )
     
@@ -179,11 +207,16 @@ class User(AbstractUser):
         help_text='用户信息最后更新时间'
     )
     
+    # 未删除用户管理器
+    active = ActiveUserManager()
+    
     class Meta:
         """模型元数据"""
         verbose_name = '用户'
         verbose_name_plural = '用户'
         db_table = 'users'
+        # 默认管理器仍为 AbstractUser 提供的 objects（认证后端、管理后台依赖它）
+        default_manager_name = 'objects'
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['username']),
@@ -191,9 +224,45 @@ class User(AbstractUser):
             models.Index(fields=['phone_number']),
             models.Index(fields=['status']),
             models.Index(fields=['user_type']),
-            models.Index(fields=['created_at']),
+            # 仅索引未删除的用户（列表查询和游标分页都带有 is_deleted=False 条件）
+            models.Index(
+                fields=['created_at', 'id'],
+                name='users_active_created_idx',
+                condition=models.Q(is_deleted=False),
+            ),
+        ]
+        constraints = [
+            # 邮箱唯一（未填写邮箱的用户除外），注册时由数据库约束检查重复
+            models.UniqueConstraint(
+                fields=['email'],
+                name='users_email_uniq',
+                condition=~models.Q(email=''),
+            ),
         ]
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        从数据库行构建实例
+        
+        记录加载时的联系方式，保存时据此判断是否变更，无需再次查询数据库。
+        
+        Args:
+            db: 数据库别名
+            field_names: 查询的字段名
+            values: 字段值
+            
+        Returns:
+            User: 用户实例
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_contact = {
+            field: instance.__dict__[field]
+            for field in CONTACT_FIELDS
+            if field in instance.__dict__
+        }
+        return instance
+    
     def __str__(self):
         """
         字符串表示
@@ -247,6 +316,19 @@ class User(AbstractUser):
         """
         return self.nickname or self.username or self.email
     
+    @property
+    def avatar_url(self):
+        """
+        头像访问地址
+        
+        直接拼接 `MEDIA_URL` 与文件名，不调用存储后端的 `url()`（对象存储下会逐行生成签名地址）。
+        
+        Returns:
+            Optional[str]: 头像地址，未上传头像时返回 None
+        """
+        name = self.avatar.name
+        return f"{settings.MEDIA_URL}{name}" if name else None
+    
     def update_last_login_info(self, ip_address):
         """
         更新最后登录信息
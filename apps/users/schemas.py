@@ -8,7 +8,14 @@ from ninja import Schema
 from ninja import FilterSchema
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from pydantic import Field, EmailStr, validator
+from pydantic import Field, EmailStr, ValidationInfo, field_validator
+from django.db.models import Q
+
+# 手机号格式与模型共用同一定义（由 pydantic-core 在构建模式时编译一次）
+from .models import PHONE_PATTERN
+
+# 用户名中允许的分隔符，校验时先删除再检查其余字符是否为字母或数字
+USERNAME_SEPARATORS = str.maketrans('', '', '_-')
 
 
 class UserBase(Schema):
@@ -16,7 +23,7 @@ class UserBase(Schema):
     username: str = Field(..., min_length=3, max_length=150, description='用户名')
     email: EmailStr = Field(..., description='邮箱地址')
     nickname: Optional[str] = Field(None, max_length=50, description='昵称')
-    phone_number: Optional[str] = Field(None, pattern=r'^1[3-9]\d{9}$', description='手机号码')
+    phone_number: Optional[str] = Field(None, pattern=PHONE_PATTERN, description='手机号码')
 
 
 class UserCreate(UserBase):
@@ -24,17 +31,19 @@ class UserCreate(UserBase):
     password: str = Field(..., min_length=8, max_length=128, description='密码')
     password_confirm: str = Field(..., min_length=8, max_length=128, description='确认密码')
     
-    @validator('password_confirm')
-    def passwords_match(cls, v, values):
+    @field_validator('password_confirm')
+    @classmethod
+    def passwords_match(cls, v, info: ValidationInfo):
         """验证密码是否匹配"""
-        if 'password' in values and v != values['password']:
+        if 'password' in info.data and v != info.data['password']:
             raise ValueError('两次输入的密码不一致')
         return v
     
-    @validator('username')
+    @field_validator('username')
+    @classmethod
     def username_alphanumeric(cls, v):
         """验证用户名格式"""
-        if not v.replace('_', '').replace('-', '').isalnum():
+        if not v.translate(USERNAME_SEPARATORS).isalnum():
             raise ValueError('用户名只能包含字母、数字、下划线和连字符')
         return v.lower()
 
@@ -43,7 +52,7 @@ class UserUpdate(Schema):
     """用户更新模式"""
     nickname: Optional[str] = Field(None, max_length=50, description='昵称')
     email: Optional[EmailStr] = Field(None, description='邮箱地址')
-    phone_number: Optional[str] = Field(None, pattern=r'^1[3-9]\d{9}$', description='手机号码')
+    phone_number: Optional[str] = Field(None, pattern=PHONE_PATTERN, description='手机号码')
     birth_date: Optional[datetime] = Field(None, description='生日')
     bio: Optional[str] = Field(None, max_length=500, description='个人简介')
     timezone: Optional[str] = Field(None, description='时区')
@@ -57,17 +66,27 @@ class UserPasswordUpdate(Schema):
     new_password: str = Field(..., min_length=8, max_length=128, description='新密码')
     new_password_confirm: str = Field(..., min_length=8, max_length=128, description='确认新密码')
     
-    @validator('new_password_confirm')
-    def passwords_match(cls, v, values):
+    @field_validator('new_password_confirm')
+    @classmethod
+    def passwords_match(cls, v, info: ValidationInfo):
         """验证新密码是否匹配"""
-        if 'new_password' in values and v != values['new_password']:
+        if 'new_password' in info.data and v != info.data['new_password']:
             raise ValueError('两次输入的新密码不一致')
         return v
 
 
-class UserResponse(UserBase):
-    """用户响应模式"""
+class UserResponse(Schema):
+    """
+    用户响应模式
+    
+    数据来自数据库中已校验过的用户记录，字段均使用普通类型声明，
+    序列化时不再重复执行邮箱格式、手机号正则和长度等输入校验。
+    """
     id: int = Field(..., description='用户ID')
+    username: str = Field(..., description='用户名')
+    email: str = Field(..., description='邮箱地址')
+    nickname: Optional[str] = Field(None, description='昵称')
+    phone_number: Optional[str] = Field(None, description='手机号码')
     user_type: str = Field(..., description='用户类型')
     status: str = Field(..., description='用户状态')
     email_verified: bool = Field(..., description='邮箱是否验证')
@@ -93,16 +112,31 @@ class UserListResponse(Schema):
 
 
 class UserFilter(FilterSchema):
-    """用户过滤模式"""
-    username: Optional[str] = Field(None, description='用户名（模糊匹配）')
-    email: Optional[str] = Field(None, description='邮箱（模糊匹配）')
-    nickname: Optional[str] = Field(None, description='昵称（模糊匹配）')
+    """
+    用户过滤模式
+    
+    各字段通过 `q` 声明对应的查询表达式，由 `filter()` 一次构建全部过滤条件。
+    """
+    username: Optional[str] = Field(None, description='用户名（模糊匹配）', json_schema_extra={'q': 'username__icontains'})
+    email: Optional[str] = Field(None, description='邮箱（模糊匹配）', json_schema_extra={'q': 'email__icontains'})
+    nickname: Optional[str] = Field(None, description='昵称（模糊匹配）', json_schema_extra={'q': 'nickname__icontains'})
     user_type: Optional[str] = Field(None, description='用户类型')
     status: Optional[str] = Field(None, description='用户状态')
     email_verified: Optional[bool] = Field(None, description='邮箱验证状态')
     phone_verified: Optional[bool] = Field(None, description='手机验证状态')
-    created_at_start: Optional[datetime] = Field(None, description='创建时间开始')
-    created_at_end: Optional[datetime] = Field(None, description='创建时间结束')
+    created_at_start: Optional[datetime] = Field(None, description='创建时间开始', json_schema_extra={'q': 'created_at__gte'})
+    created_at_end: Optional[datetime] = Field(None, description='创建时间结束', json_schema_extra={'q': 'created_at__lte'})
+    cursor: Optional[int] = Field(None, description='游标：上一页最后一个用户的ID（深分页时使用，配合 offset=0）')
+    
+    @field_validator('username', 'email', 'nickname', 'user_type', 'status', mode='before')
+    @classmethod
+    def empty_str_to_none(cls, v):
+        """空字符串视为未提供该过滤条件"""
+        return None if v == '' else v
+    
+    def filter_cursor(self, value):
+        """游标不是过滤条件，由视图单独处理"""
+        return Q()
 
 
 class UserProfileBase(Schema):
@@ -148,6 +182,11 @@ class UserDetailResponse(Schema):
     profile: Optional[UserProfileResponse] = Field(None, description='用户资料')
 
 
+class UserBulkRequest(Schema):
+    """批量获取用户请求模式"""
+    ids: List[int] = Field(..., min_length=1, max_length=100, description='用户ID列表（最多100个）')
+
+
 class UserLoginRequest(Schema):
     """用户登录请求模式"""
     username: str = Field(..., description='用户名或邮箱')
@@ -186,10 +225,11 @@ class PasswordResetConfirm(Schema):
     new_password: str = Field(..., min_length=8, max_length=128, description='新密码')
     new_password_confirm: str = Field(..., min_length=8, max_length=128, description='确认新密码')
     
-    @validator('new_password_confirm')
-    def passwords_match(cls, v, values):
+    @field_validator('new_password_confirm')
+    @classmethod
+    def passwords_match(cls, v, info: ValidationInfo):
         """验证新密码是否匹配"""
-        if 'new_password' in values and v != values['new_password']:
+        if 'new_password' in info.data and v != info.data['new_password']:
             raise ValueError('两次输入的新密码不一致')
         return v
 
@@ -206,10 +246,10 @@ class EmailVerificationConfirm(Schema):
 
 class PhoneVerificationRequest(Schema):
     """手机验证请求模式"""
-    phone_number: str = Field(..., pattern=r'^1[3-9]\d{9}$', description='手机号码')
+    phone_number: str = Field(..., pattern=PHONE_PATTERN, description='手机号码')
 
 
 class PhoneVerificationConfirm(Schema):
     """手机验证确认模式"""
-    phone_number: str = Field(..., pattern=r'^1[3-9]\d{9}$', description='手机号码')
+    phone_number: str = Field(..., pattern=PHONE_PATTERN, description='手机号码')
     code: str = Field(..., min_length=4, max_length=6, description='验证码')
\ No newline at end of file
@@ -5,12 +5,27 @@
 """
 
 from django.contrib.auth import get_user_model
-from django.db import transaction
+from django.contrib.auth.hashers import check_password, make_password
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Q
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.contrib.auth.password_validation import validate_password
+from django.core.mail import EmailMessage, get_connection
+from django.conf import settings
+from django.contrib.auth.password_validation import password_changed, validate_password
 from django.utils import timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence, Tuple
+from asgiref.sync import sync_to_async
 import logging
+import queue
+import threading
+
+# 导入认证服务（清除 Token 校验使用的用户有效状态缓存）
+from apps.authentication.services import AuthService
+
+# 导入模型和模式
+from .models import UserProfile
+from .schemas import UserCreate
 
 # 获取用户模型
 User = get_user_model()
@@ -18,6 +33,59 @@ User = get_user_model()
 # 配置日志
 logger = logging.getLogger(__name__)
 
+# 用户标识字段（按匹配优先级排列）
+USER_IDENTIFIER_FIELDS = ('username', 'email', 'phone_number')
+
+# 注册时可选填写的用户字段
+USER_OPTIONAL_FIELDS = ('nickname', 'phone_number', 'birth_date', 'bio', 'timezone', 'language')
+
+# 唯一约束字段及冲突时的提示名称（按顺序匹配数据库错误中的约束名或列名）
+USER_UNIQUE_FIELDS = (
+    ('username', '用户名'),
+    ('email', '邮箱'),
+    ('phone_number', '手机号'),
+)
+
+# 单次复用 SMTP 连接发送的欢迎邮件数量上限
+WELCOME_EMAIL_BATCH_SIZE = 50
+
+# 待发送的欢迎邮件队列及后台发送线程
+_welcome_email_queue = queue.SimpleQueue()
+_welcome_email_worker = None
+_welcome_email_worker_lock = threading.Lock()
+
+
+def _welcome_email_loop() -> None:
+    """
+    欢迎邮件发送循环
+
+    阻塞等待队列中的邮件，取到后顺带取出已排队的其余邮件（不超过批量上限），
+    通过同一个 SMTP 连接一并发送。
+    """
+    while True:
+        batch = [_welcome_email_queue.get()]
+        while len(batch) < WELCOME_EMAIL_BATCH_SIZE:
+            try:
+                batch.append(_welcome_email_queue.get_nowait())
+            except queue.Empty:
+                break
+        UserService.send_welcome_emails(batch)
+
+
+def _ensure_welcome_email_worker() -> None:
+    """启动欢迎邮件后台发送线程（每个进程只启动一次）"""
+    global _welcome_email_worker
+    if _welcome_email_worker is not None and _welcome_email_worker.is_alive():
+        return
+    with _welcome_email_worker_lock:
+        if _welcome_email_worker is None or not _welcome_email_worker.is_alive():
+            _welcome_email_worker = threading.Thread(
+                target=_welcome_email_loop,
+                name='welcome-email',
+                daemon=True,
+            )
+            _welcome_email_worker.start()
+
 
 class UserService:
     """
@@ -26,14 +94,22 @@ class UserService:
     提供用户相关的业务逻辑处理方法。
     """
     
+    # 用户详情缓存时间（秒）
+    USER_CACHE_TIMEOUT = 300
+    
+    # 用户总数估算值缓存时间（秒）
+    ACTIVE_USER_COUNT_TIMEOUT = 60
+    
+    # 仅包含未删除用户的部分索引，其统计行数即未删除用户数的估算值
+    ACTIVE_USER_INDEX = 'users_active_created_idx'
+    
     @staticmethod
-    @transaction.atomic
-    def create_user(user_data: Dict[str, Any]) -> User:
+    def create_user(user_data: UserCreate) -> User:
         """
         创建新用户
         
         Args:
-            user_data: 用户数据字典，包含用户名、邮箱、密码等
+            user_data: 用户注册数据模式，直接读取属性而无需先转换为字典
             
         Returns:
             User: 创建的用户实例
@@ -42,47 +118,70 @@ class UserService:
             ValidationError: 当数据验证失败时抛出
         """
         try:
-            # 验证密码
-            validate_password(user_data['password'])
-            
-            # 检查用户名是否已存在
-            if User.objects.filter(username=user_data['username']).exists():
-                raise ValidationError(f"用户名 '{user_data['username']}' 已存在")
-            
-            # 检查邮箱是否已存在
-            if User.objects.filter(email=user_data['email']).exists():
-                raise ValidationError(f"邮箱 '{user_data['email']}' 已存在")
-            
-            # 创建用户
-            user = User.objects.create_user(
-                username=user_data['username'],
-                email=user_data['email'],
-                password=user_data['password']
-            )
+            # 验证密码（在事务外执行，不占用数据库连接的事务时间）
+            validate_password(user_data.password)
             
-            # 设置可选字段
-            optional_fields = ['nickname', 'phone_number', 'birth_date', 'bio', 'timezone', 'language']
-            for field in optional_fields:
-                if field in user_data and user_data[field] is not None:
-                    setattr(user, field, user_data[field])
+            # 可选字段随创建一起写入，只执行一次 INSERT
+            extra_fields = {
+                field: value
+                for field in USER_OPTIONAL_FIELDS
+                if (value := getattr(user_data, field, None)) is not None
+            }
             
-            user.save()
+            # 创建用户（连同信号创建的用户资料在同一事务中），用户名、邮箱和手机号的唯一性由数据库约束保证
+            try:
+                with transaction.atomic():
+                    user = User.objects.create_user(
+                        username=user_data.username,
+                        email=user_data.email,
+                        password=user_data.password,
+                        **extra_fields
+                    )
+            except IntegrityError as e:
+                raise ValidationError(UserService._unique_violation_message(e, user_data))
             
             # 注意：用户资料由信号自动创建，不需要手动创建
             # 创建用户资料
             # from .models import UserProfile
             # UserProfile.objects.create(user=user)
             
-            logger.info(f"用户创建成功: {user.username}")
+            logger.info("用户创建成功: %s", user.username)
             return user
             
         except ValidationError as e:
-            logger.error(f"用户创建失败 - 验证错误: {e}")
+            logger.error("用户创建失败 - 验证错误: %s", e)
             raise
         except Exception as e:
-            logger.error(f"用户创建失败: {e}")
+            logger.error("用户创建失败: %s", e)
             raise ValidationError(f"用户创建失败: {str(e)}")
     
+    @staticmethod
+    def _unique_violation_message(
+        error: IntegrityError,
+        user_data: Any,
+        fallback: str = "用户创建失败",
+    ) -> str:
+        """
+        将唯一约束冲突转换为提示信息
+        
+        PostgreSQL 从驱动提供的约束名判断冲突字段，其他数据库从错误信息中的列名判断。
+        
+        Args:
+            error: 数据库完整性错误
+            user_data: 写入的用户数据（注册数据模式或更新字段字典）
+            fallback: 无法判断冲突字段时的提示前缀
+            
+        Returns:
+            str: 冲突字段的提示信息
+        """
+        diag = getattr(error.__cause__, 'diag', None)
+        detail = getattr(diag, 'constraint_name', None) or str(error)
+        for field, label in USER_UNIQUE_FIELDS:
+            if field in detail:
+                value = user_data.get(field) if isinstance(user_data, dict) else getattr(user_data, field)
+                return f"{label} '{value}' 已存在"
+        return f"{fallback}: {error}"
+    
     @staticmethod
     @transaction.atomic
     def update_user(user: User, update_data: Dict[str, Any]) -> User:
@@ -100,28 +199,41 @@ class UserService:
             ValidationError: 当数据验证失败时抛出
         """
         try:
-            # 更新用户字段
-            update_fields = []
-            
             # 基本字段
             basic_fields = ['nickname', 'email', 'phone_number', 'birth_date', 'bio', 'timezone', 'language']
-            for field in basic_fields:
-                if field in update_data and update_data[field] is not None:
-                    setattr(user, field, update_data[field])
-                    update_fields.append(field)
-            
-            # 如果有更新，保存用户
-            if update_fields:
-                user.save(update_fields=update_fields)
-                logger.info(f"用户更新成功: {user.username}, 更新字段: {update_fields}")
+            clean_data = {
+                field: update_data[field]
+                for field in basic_fields
+                if update_data.get(field) is not None
+            }
+            
+            # 如果有更新，以一条 UPDATE 写入（不经过 save() 和保存信号）
+            if clean_data:
+                # 邮箱或手机号变更时重置对应的验证状态
+                if 'email' in clean_data and clean_data['email'] != user.email:
+                    clean_data['email_verified'] = False
+                if 'phone_number' in clean_data and clean_data['phone_number'] != user.phone_number:
+                    clean_data['phone_verified'] = False
+                clean_data['updated_at'] = timezone.now()
+                
+                try:
+                    User.objects.filter(pk=user.pk).update(**clean_data)
+                except IntegrityError as e:
+                    raise ValidationError(UserService._unique_violation_message(e, clean_data, "用户更新失败"))
+                
+                # 同步内存中的实例，并清除保存信号原本负责清除的用户缓存
+                for field, value in clean_data.items():
+                    setattr(user, field, value)
+                UserService.invalidate_user_cache(user.pk)
+                logger.info("用户更新成功: %s, 更新字段: %s", user.username, list(clean_data))
             
             return user
             
         except ValidationError as e:
-            logger.error(f"用户更新失败 - 验证错误: {e}")
+            logger.error("用户更新失败 - 验证错误: %s", e)
             raise
         except Exception as e:
-            logger.error(f"用户更新失败: {e}")
+            logger.error("用户更新失败: %s", e)
             raise ValidationError(f"用户更新失败: {str(e)}")
     
     @staticmethod
@@ -152,16 +264,83 @@ class UserService:
             user.set_password(new_password)
             user.save(update_fields=['password'])
             
-            logger.info(f"用户密码更新成功: {user.username}")
+            logger.info("用户密码更新成功: %s", user.username)
             return True
             
         except ValidationError as e:
-            logger.error(f"用户密码更新失败 - 验证错误: {e}")
+            logger.error("用户密码更新失败 - 验证错误: %s", e)
             raise
         except Exception as e:
-            logger.error(f"用户密码更新失败: {e}")
+            logger.error("用户密码更新失败: %s", e)
             raise ValidationError(f"密码更新失败: {str(e)}")
     
+    @staticmethod
+    async def aupdate_password(user: User, old_password: str, new_password: str) -> bool:
+        """
+        异步更新用户密码
+        
+        密码哈希校验和新密码哈希是纯 CPU 计算，放到独立线程池执行，不阻塞事件循环；
+        强度验证可能读取模型属性或访问数据库，使用线程敏感模式执行。计算完成后在行锁内
+        核对旧哈希并通过 `save()` 写入，密码已被并发修改时不会覆盖，保存信号照常触发
+        （缓存由信号处理器清除）。
+        
+        Args:
+            user: 要更新密码的用户
+            old_password: 当前密码
+            new_password: 新密码
+            
+        Returns:
+            bool: 密码更新成功返回 True
+            
+        Raises:
+            ValidationError: 当密码验证失败时抛出
+        """
+        # 验证旧密码（不使用 user.check_password，避免在线程池中触发升级哈希的保存）
+        old_hash = user.password
+        if not await sync_to_async(check_password, thread_sensitive=False)(old_password, old_hash):
+            raise ValidationError("当前密码不正确")
+        
+        # 验证新密码（验证器可能访问数据库，使用线程敏感执行）
+        await sync_to_async(validate_password)(new_password, user)
+        
+        # 计算新密码哈希
+        new_hash = await sync_to_async(make_password, thread_sensitive=False)(new_password)
+        
+        # 在行锁内写入（锁和事务需在同一数据库连接上，使用默认的线程敏感执行）
+        await sync_to_async(UserService._save_password_locked)(user, old_hash, new_hash)
+        
+        # 通知密码验证器密码已修改（直接写入哈希时 AbstractBaseUser.save 不会调用）
+        await sync_to_async(password_changed)(new_password, user)
+        
+        logger.info("用户密码更新成功: %s", user.username)
+        return True
+    
+    @staticmethod
+    def _save_password_locked(user: User, old_hash: str, new_hash: str) -> None:
+        """
+        锁定用户行并保存新密码哈希
+        
+        Args:
+            user: 要更新密码的用户
+            old_hash: 校验时读取的旧密码哈希
+            new_hash: 新密码哈希
+            
+        Raises:
+            ValidationError: 密码已被并发修改时抛出
+        """
+        with transaction.atomic():
+            current_hash = (
+                User.objects.select_for_update()
+                .filter(pk=user.pk)
+                .values_list('password', flat=True)
+                .first()
+            )
+            if current_hash != old_hash:
+                raise ValidationError("密码已被修改，请重新操作")
+            
+            user.password = new_hash
+            user.save(update_fields=['password', 'updated_at'])
+    
     @staticmethod
     def soft_delete_user(user: User) -> bool:
         """
@@ -175,12 +354,104 @@ class UserService:
         """
         try:
             user.soft_delete()
-            logger.info(f"用户软删除成功: {user.username}")
+            logger.info("用户软删除成功: %s", user.username)
             return True
         except Exception as e:
-            logger.error(f"用户软删除失败: {e}")
+            logger.error("用户软删除失败: %s", e)
             raise ValidationError(f"用户删除失败: {str(e)}")
     
+    @staticmethod
+    def soft_delete_user_by_id(user_id: int) -> bool:
+        """
+        根据用户ID软删除用户
+        
+        直接执行一条 UPDATE 语句，无需先加载用户。批量更新不会触发模型信号，
+        因此在此手动清除用户相关缓存。
+        
+        Args:
+            user_id: 用户ID
+            
+        Returns:
+            bool: 删除成功返回 True，用户不存在或已删除返回 False
+        """
+        now = timezone.now()
+        updated = User.active.filter(id=user_id).update(
+            is_deleted=True,
+            deleted_at=now,
+            status='deleted',
+            updated_at=now,  # 批量更新不会自动刷新 auto_now 字段
+        )
+        if not updated:
+            return False
+        
+        UserService.invalidate_user_cache(user_id)
+        UserService.invalidate_active_user_count()
+        AuthService.invalidate_user_active(user_id)
+        
+        logger.info("用户软删除成功: %s", user_id)
+        return True
+    
+    @staticmethod
+    def bulk_soft_delete(user_qs) -> int:
+        """
+        批量软删除用户
+        
+        以一条 UPDATE 语句删除查询集中的全部未删除用户。与 `QuerySet.update()` 一致，
+        不会触发模型信号，因此在此手动清除相关缓存。
+        
+        Args:
+            user_qs: 用户查询集
+            
+        Returns:
+            int: 实际删除的用户数量
+        """
+        user_ids = list(user_qs.filter(is_deleted=False).values_list('pk', flat=True))
+        if not user_ids:
+            return 0
+        
+        now = timezone.now()
+        updated = User.objects.filter(pk__in=user_ids).update(
+            is_deleted=True,
+            deleted_at=now,
+            status='deleted',
+            updated_at=now,
+        )
+        
+        UserService.invalidate_user_caches(user_ids)
+        
+        logger.info("用户批量软删除成功: %s", updated)
+        return updated
+    
+    @staticmethod
+    def bulk_restore(user_qs) -> int:
+        """
+        批量恢复软删除的用户
+        
+        以一条 UPDATE 语句恢复查询集中的全部已删除用户，不会触发模型信号，
+        因此在此手动清除相关缓存。
+        
+        Args:
+            user_qs: 用户查询集
+            
+        Returns:
+            int: 实际恢复的用户数量
+        """
+        user_ids = list(user_qs.filter(is_deleted=True).values_list('pk', flat=True))
+        if not user_ids:
+            return 0
+        
+        updated = User.objects.filter(pk__in=user_ids).update(
+            is_deleted=False,
+            deleted_at=None,
+            status='active',
+            updated_at=timezone.now(),
+        )
+        
+        UserService.invalidate_user_caches(user_ids)
+        
+        logger.info("用户批量恢复成功: %s", updated)
+        return updated
+    
     @staticmethod
     def restore_user(user: User) -> bool:
         """
@@ -194,65 +465,254 @@ class UserService:
         """
         try:
             user.restore()
-            logger.info(f"用户恢复成功: {user.username}")
+            logger.info("用户恢复成功: %s", user.username)
             return True
         except Exception as e:
-            logger.error(f"用户恢复失败: {e}")
+            logger.error("用户恢复失败: %s", e)
             raise ValidationError(f"用户恢复失败: {str(e)}")
     
     @staticmethod
-    def get_user_by_username(username: str) -> Optional[User]:
+    def get_cached_user(user_id: int) -> User:
+        """
+        获取用户（含用户资料），优先读取缓存
+        
+        结果缓存 `USER_CACHE_TIMEOUT` 秒，用户或用户资料保存、删除时由信号清除。
+        返回的实例仅用于读取，更新用户时应从数据库重新获取。
+        
+        Args:
+            user_id: 用户ID
+            
+        Returns:
+            User: 未删除的用户实例
+            
+        Raises:
+            User.DoesNotExist: 用户不存在或已删除时抛出
+        """
+        cache_key = f"user:{user_id}"
+        user = cache.get(cache_key)
+        if user is None:
+            # 响应中不包含的元数据和密码哈希不加载，也不写入缓存
+            user = User.active.select_related('profile').defer(
+                'metadata', 'password'
+            ).get(pk=user_id)
+            cache.set(cache_key, user, timeout=UserService.USER_CACHE_TIMEOUT)
+        return user
+    
+    @staticmethod
+    def invalidate_user_cache(user_id: int) -> None:
+        """
+        清除用户缓存
+        
+        Args:
+            user_id: 用户ID
+        """
+        cache.delete(f"user:{user_id}")
+    
+    @staticmethod
+    def invalidate_user_caches(user_ids: List[int]) -> None:
+        """
+        批量清除用户缓存、用户有效状态缓存和用户总数估算值缓存
+        
+        Args:
+            user_ids: 用户ID列表
+        """
+        cache.delete_many([f"user:{user_id}" for user_id in user_ids])
+        AuthService.invalidate_users_active(user_ids)
+        UserService.invalidate_active_user_count()
+    
+    @staticmethod
+    def estimate_active_user_count() -> int:
+        """
+        估算未删除用户总数
+        
+        PostgreSQL 读取部分索引 `ACTIVE_USER_INDEX`（条件为 is_deleted = false）
+        统计信息中的估算行数，因此不包含已软删除的用户；其他数据库执行一次 COUNT(*)；
+        结果缓存 `ACTIVE_USER_COUNT_TIMEOUT` 秒，用户创建或删除时由信号清除。
+        
+        Returns:
+            int: 用户总数（估算值）
+        """
+        count = cache.get('users:active_count')
+        if count is None:
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                        [UserService.ACTIVE_USER_INDEX]
+                    )
+                    row = cursor.fetchone()
+                # 索引从未被统计时 reltuples 为 -1，回退到精确计数
+                if row and row[0] >= 0:
+                    count = row[0]
+            if count is None:
+                count = User.active.count()
+            cache.set('users:active_count', count, timeout=UserService.ACTIVE_USER_COUNT_TIMEOUT)
+        return count
+    
+    @staticmethod
+    def invalidate_active_user_count() -> None:
+        """清除用户总数估算值缓存"""
+        cache.delete('users:active_count')
+    
+    @staticmethod
+    def send_welcome_emails(recipients: List[Tuple[str, str]]) -> None:
+        """
+        批量发送欢迎邮件
+        
+        所有邮件复用同一个 SMTP 连接发送，避免每封邮件都重新建立连接和 TLS 握手。
+        发送失败只记录日志，不向调用方抛出异常。
+        
+        Args:
+            recipients: (收件人邮箱, 用户显示名称) 列表
+        """
+        messages = [
+            EmailMessage(
+                subject='欢迎注册！',
+                body=f'亲爱的 {display_name}，欢迎注册我们的平台！',
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[email],
+            )
+            for email, display_name in recipients
+        ]
+        try:
+            with get_connection(fail_silently=True) as connection:
+                sent = connection.send_messages(messages) or 0
+            logger.info("欢迎邮件发送成功: %d/%d", sent, len(messages))
+        except Exception as e:
+            logger.error("欢迎邮件发送失败: %s", e)
+    
+    @staticmethod
+    def send_welcome_email(email: str, display_name: str) -> None:
+        """
+        发送欢迎邮件
+        
+        Args:
+            email: 收件人邮箱
+            display_name: 用户显示名称
+        """
+        UserService.send_welcome_emails([(email, display_name)])
+    
+    @staticmethod
+    def enqueue_welcome_email(email: str, display_name: str) -> None:
+        """
+        异步发送欢迎邮件
+        
+        将邮件放入发送队列，由后台守护线程批量发送，注册请求无需等待 SMTP 交互完成。
+        
+        Args:
+            email: 收件人邮箱
+            display_name: 用户显示名称
+        """
+        _welcome_email_queue.put((email, display_name))
+        _ensure_welcome_email_worker()
+    
+    @staticmethod
+    def _active_users(fields: Optional[Sequence[str]] = None):
+        """
+        获取未删除用户的查询集
+        
+        Args:
+            fields: 只查询的字段，为 None 时查询全部字段
+            
+        Returns:
+            QuerySet: 用户查询集
+        """
+        if fields is None:
+            return User.active.all()
+        return User.active.only(*fields)
+    
+    @staticmethod
+    def get_user_by_username(username: str, fields: Optional[Sequence[str]] = None) -> Optional[User]:
         """
         根据用户名获取用户
         
         Args:
             username: 用户名
+            fields: 只查询的字段，为 None 时查询全部字段；访问未查询的字段会额外执行一次查询
             
         Returns:
             User: 用户实例，不存在返回 None
         """
         try:
-            return User.objects.get(username=username, is_deleted=False)
+            return UserService._active_users(fields).get(username=username)
         except User.DoesNotExist:
             return None
     
     @staticmethod
-    def get_user_by_email(email: str) -> Optional[User]:
+    def get_user_by_email(email: str, fields: Optional[Sequence[str]] = None) -> Optional[User]:
         """
         根据邮箱获取用户
         
         Args:
             email: 邮箱地址
+            fields: 只查询的字段，为 None 时查询全部字段；访问未查询的字段会额外执行一次查询
             
         Returns:
             User: 用户实例，不存在返回 None
         """
         try:
-            return User.objects.get(email=email, is_deleted=False)
+            return UserService._active_users(fields).get(email=email)
         except User.DoesNotExist:
             return None
     
     @staticmethod
-    def get_user_by_phone(phone: str) -> Optional[User]:
+    def get_user_by_phone(phone: str, fields: Optional[Sequence[str]] = None) -> Optional[User]:
         """
         根据手机号获取用户
         
         Args:
             phone: 手机号
+            fields: 只查询的字段，为 None 时查询全部字段；访问未查询的字段会额外执行一次查询
             
         Returns:
             User: 用户实例，不存在返回 None
         """
         try:
-            return User.objects.get(phone_number=phone, is_deleted=False)
+            return UserService._active_users(fields).get(phone_number=phone)
         except User.DoesNotExist:
             return None
     
+    @staticmethod
+    def get_user_by_identifier(value: str, fields: Optional[Sequence[str]] = None) -> Optional[User]:
+        """
+        根据用户名、邮箱或手机号获取用户
+        
+        一次查询同时匹配三个标识字段（各字段均有索引），代替依次调用
+        `get_user_by_username`、`get_user_by_email`、`get_user_by_phone` 的三次查询。
+        多个用户分别匹配不同字段时，按 用户名 > 邮箱 > 手机号 的优先级选取。
+        
+        Args:
+            value: 用户名、邮箱或手机号
+            fields: 只查询的字段，为 None 时查询全部字段（标识字段始终会被查询）
+            
+        Returns:
+            User: 用户实例，不存在返回 None
+        """
+        if fields is not None:
+            fields = (*fields, *USER_IDENTIFIER_FIELDS)
+        candidates = list(
+            UserService._active_users(fields).filter(
+                Q(username=value) | Q(email=value) | Q(phone_number=value)
+            )[:len(USER_IDENTIFIER_FIELDS)]
+        )
+        return next(
+            (
+                candidate
+                for field in USER_IDENTIFIER_FIELDS
+                for candidate in candidates
+                if getattr(candidate, field) == value
+            ),
+            None
+        )
+    
     @staticmethod
     def search_users(query: str, limit: int = 20) -> list:
         """
         搜索用户
         
+        PostgreSQL 下各匹配字段均有 `pg_trgm` GIN 索引（见 `signals.TRIGRAM_INDEX_FIELDS`），
+        `icontains` 条件可直接使用索引，无需改写查询。
+        
         Args:
             query: 搜索查询字符串
             limit: 返回结果数量限制
@@ -260,14 +720,11 @@ class UserService:
         Returns:
             list: 用户列表
         """
-        from django.db.models import Q
-        
-        return User.objects.filter(
+        return User.active.filter(
             Q(username__icontains=query) |
             Q(email__icontains=query) |
             Q(nickname__icontains=query) |
-            Q(phone_number__icontains=query),
-            is_deleted=False
+            Q(phone_number__icontains=query)
         ).order_by('-created_at')[:limit]
     
     @staticmethod
@@ -284,10 +741,10 @@ class UserService:
         try:
             user.email_verified = True
             user.save(update_fields=['email_verified'])
-            logger.info(f"用户邮箱验证成功: {user.username}")
+            logger.info("用户邮箱验证成功: %s", user.username)
             return True
         except Exception as e:
-            logger.error(f"用户邮箱验证失败: {e}")
+            logger.error("用户邮箱验证失败: %s", e)
             raise ValidationError(f"邮箱验证失败: {str(e)}")
     
     @staticmethod
@@ -304,10 +761,10 @@ class UserService:
         try:
             user.phone_verified = True
             user.save(update_fields=['phone_verified'])
-            logger.info(f"用户手机验证成功: {user.username}")
+            logger.info("用户手机验证成功: %s", user.username)
             return True
         except Exception as e:
-            logger.error(f"用户手机验证失败: {e}")
+            logger.error("用户手机验证失败: %s", e)
             raise ValidationError(f"手机验证失败: {str(e)}")
 
 
@@ -332,29 +789,34 @@ class UserProfileService:
         """
         try:
             # 获取或创建用户资料
-            from .models import UserProfile
             try:
                 profile = user.profile
             except UserProfile.DoesNotExist:
                 profile = UserProfile.objects.create(user=user)
             
             # 更新资料字段
-            update_fields = []
             profile_fields = ['gender', 'occupation', 'company', 'address', 'website', 'interests', 'social_links', 'tags', 'privacy_settings']
-            
-            for field in profile_fields:
-                if field in profile_data and profile_data[field] is not None:
-                    setattr(profile, field, profile_data[field])
-                    update_fields.append(field)
-            
-            if update_fields:
-                profile.save(update_fields=update_fields)
-                logger.info(f"用户资料更新成功: {user.username}, 更新字段: {update_fields}")
+            clean_data = {
+                field: profile_data[field]
+                for field in profile_fields
+                if profile_data.get(field) is not None
+            }
+            
+            # 如果有更新，以一条 UPDATE 写入（不经过 save() 和保存信号）
+            if clean_data:
+                clean_data['updated_at'] = timezone.now()
+                UserProfile.objects.filter(pk=profile.pk).update(**clean_data)
+                
+                # 同步内存中的资料，并清除缓存的用户（包含资料）
+                for field, value in clean_data.items():
+                    setattr(profile, field, value)
+                UserService.invalidate_user_cache(user.pk)
+                logger.info("用户资料更新成功: %s, 更新字段: %s", user.username, list(clean_data))
             
             return profile
             
         except Exception as e:
-            logger.error(f"用户资料更新失败: {e}")
+            logger.error("用户资料更新失败: %s", e)
             raise ValidationError(f"用户资料更新失败: {str(e)}")
     
     @staticmethod
@@ -368,8 +830,6 @@ class UserProfileService:
         Returns:
             UserProfile: 用户资料，不存在则创建
         """
-        from .models import UserProfile
-        
         try:
             return user.profile
         except UserProfile.DoesNotExist:
@@ -4,19 +4,31 @@
 处理用户相关的 Django 信号，如用户创建、更新、删除等事件。
 """
 
+from django.db import DatabaseError, connections, transaction
 from django.db.models.signals import post_save, pre_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
-from django.core.mail import send_mail
-from django.conf import settings
 import logging
 
+# 导入服务
+from .services import UserService
+
+# 导入模型
+from .models import CONTACT_FIELDS, UserProfile
+
 # 获取用户模型
 User = get_user_model()
 
 # 配置日志
 logger = logging.getLogger(__name__)
 
+# 用户列表过滤和用户搜索中使用模糊匹配（icontains）的字段，PostgreSQL 下为其创建三元组索引
+# （搜索的 OR 条件中每个字段都有索引时，才能以 BitmapOr 合并索引扫描代替全表扫描）
+TRIGRAM_INDEX_FIELDS = ('username', 'email', 'nickname', 'phone_number')
+
+# 创建时间 BRIN 索引每个区间包含的数据页数
+CREATED_AT_BRIN_PAGES_PER_RANGE = 32
+
 
 @receiver(post_save, sender=User)
 def user_created_handler(sender, instance, created, **kwargs):
@@ -33,20 +45,14 @@ def user_created_handler(sender, instance, created, **kwargs):
     """
     if created:
         # 新用户创建时的操作
-        logger.info(f"新用户创建: {instance.username}")
+        logger.info("新用户创建: %s", instance.username)
         
-        # 发送欢迎邮件（异步任务更好）
-        try:
-            send_mail(
-                subject='欢迎注册！',
-                message=f'亲爱的 {instance.get_display_name()}，欢迎注册我们的平台！',
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[instance.email],
-                fail_silently=True,
-            )
-            logger.info(f"欢迎邮件发送成功: {instance.email}")
-        except Exception as e:
-            logger.error(f"欢迎邮件发送失败: {e}")
+        # 事务提交后在后台线程发送欢迎邮件，不阻塞注册请求，回滚时也不会误发
+        email, display_name = instance.email, instance.get_display_name()
+        transaction.on_commit(
+            lambda: UserService.enqueue_welcome_email(email, display_name),
+            using=kwargs.get('using'),
+        )
 
 
 @receiver(pre_save, sender=User)
@@ -61,25 +67,35 @@ def user_pre_save_handler(sender, instance, **kwargs):
         instance: 用户实例
         kwargs: 其他参数
     """
+    # 仅保存部分字段且不涉及联系方式时无需检查
+    update_fields = kwargs.get('update_fields')
+    fields = [
+        field for field in CONTACT_FIELDS
+        if update_fields is None or field in update_fields
+    ]
+    if not fields:
+        return
+    
+    # 与加载（或上次保存）时记录的值比较，新建或未记录的实例跳过比较
+    loaded = getattr(instance, '_loaded_contact', None) or {}
     if instance.pk:
-        # 更新操作
-        try:
-            old_user = User.objects.get(pk=instance.pk)
-            
-            # 检查邮箱是否变更
-            if old_user.email != instance.email:
-                # 如果邮箱变更，重置验证状态
-                instance.email_verified = False
-                logger.info(f"用户邮箱变更: {old_user.email} -> {instance.email}")
-            
-            # 检查手机号是否变更
-            if old_user.phone_number != instance.phone_number:
-                # 如果手机号变更，重置验证状态
-                instance.phone_verified = False
-                logger.info(f"用户手机号变更: {old_user.phone_number} -> {instance.phone_number}")
-                
-        except User.DoesNotExist:
-            pass
+        # 检查邮箱是否变更
+        if 'email' in fields and 'email' in loaded and loaded['email'] != instance.email:
+            # 如果邮箱变更，重置验证状态
+            instance.email_verified = False
+            logger.info("用户邮箱变更: %s -> %s", loaded['email'], instance.email)
+        
+        # 检查手机号是否变更
+        if 'phone_number' in fields and 'phone_number' in loaded and loaded['phone_number'] != instance.phone_number:
+            # 如果手机号变更，重置验证状态
+            instance.phone_verified = False
+            logger.info("用户手机号变更: %s -> %s", loaded['phone_number'], instance.phone_number)
+    
+    # 记录本次保存的值，供后续保存比较
+    instance._loaded_contact = {
+        **loaded,
+        **{field: instance.__dict__[field] for field in fields if field in instance.__dict__},
+    }
 
 
 @receiver(post_save, sender=User)
@@ -96,13 +112,10 @@ def user_profile_handler(sender, instance, created, **kwargs):
         kwargs: 其他参数
     """
     if created:
-        # 为新用户创建资料
-        try:
-            from .models import UserProfile
-            UserProfile.objects.get_or_create(user=instance)
-            logger.info(f"用户资料创建成功: {instance.username}")
-        except Exception as e:
-            logger.error(f"用户资料创建失败: {e}")
+        # 为新用户创建资料：用户刚插入，资料不可能已存在，直接插入而无需先查询；
+        # 插入失败时异常向上抛出，使用户与资料一同回滚
+        UserProfile.objects.create(user=instance)
+        logger.info("用户资料创建成功: %s", instance.username)
 
 
 @receiver(post_delete, sender=User)
@@ -117,11 +130,139 @@ def user_deleted_handler(sender, instance, **kwargs):
         instance: 被删除的用户实例
         kwargs: 其他参数
     """
-    logger.info(f"用户删除: {instance.username}")
+    logger.info("用户删除: %s", instance.username)
     
     # 这里可以添加用户删除后的清理操作
     # 例如：删除相关的文件、清理缓存、发送通知等
 
 
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_cache_handler(sender, instance, **kwargs):
+    """
+    用户缓存清除处理器
+    
+    用户保存或删除时清除缓存的用户详情。
+    
+    Args:
+        sender: 发送信号的模型类
+        instance: 用户实例
+        kwargs: 其他参数
+    """
+    UserService.invalidate_user_cache(instance.pk)
+
+
+@receiver(post_save, sender='users.UserProfile')
+@receiver(post_delete, sender='users.UserProfile')
+def user_profile_cache_handler(sender, instance, **kwargs):
+    """
+    用户资料缓存清除处理器
+    
+    用户资料保存或删除时清除缓存的用户详情（缓存中包含用户资料）。
+    
+    Args:
+        sender: 发送信号的模型类
+        instance: 用户资料实例
+        kwargs: 其他参数
+    """
+    UserService.invalidate_user_cache(instance.user_id)
+
+
+def trigram_index_handler(sender, using, **kwargs):
+    """
+    三元组索引创建处理器
+    
+    数据库迁移完成后，在 PostgreSQL 上启用 pg_trgm 扩展，并为模糊匹配字段创建 GIN 索引，
+    使 `icontains` 过滤不再全表扫描。Django 在 PostgreSQL 上将 `icontains` 编译为
+    `UPPER(字段::text) LIKE UPPER(...)`，因此索引建立在相同的表达式上。其他数据库不做处理。
+    
+    Args:
+        sender: 发送信号的应用配置
+        using: 数据库别名
+        kwargs: 其他参数
+    """
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return
+    
+    quote_name = connection.ops.quote_name
+    table = User._meta.db_table
+    
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+            for field in TRIGRAM_INDEX_FIELDS:
+                column = User._meta.get_field(field).column
+                cursor.execute(
+                    f'CREATE INDEX IF NOT EXISTS {quote_name(f"{table}_{column}_trgm")} '
+                    f'ON {quote_name(table)} USING gin (UPPER({quote_name(column)}::text) gin_trgm_ops)'
+                )
+    except DatabaseError as e:
+        logger.warning("三元组索引创建失败: %s", e)
+
+
+def brin_index_handler(sender, using, **kwargs):
+    """
+    创建时间 BRIN 索引创建处理器
+    
+    用户表按创建时间追加写入，`created_at` 与数据页的物理顺序基本一致。数据库迁移完成后，
+    在 PostgreSQL 上为其创建 BRIN 索引，用于 `created_at__gte/lte` 范围过滤，体积远小于 B-tree。
+    排序和游标分页仍使用模型中声明的 `(created_at, id)` 部分索引。其他数据库不做处理。
+    
+    Args:
+        sender: 发送信号的应用配置
+        using: 数据库别名
+        kwargs: 其他参数
+    """
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return
+    
+    quote_name = connection.ops.quote_name
+    table = User._meta.db_table
+    column = User._meta.get_field('created_at').column
+    
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS {quote_name(f"{table}_{column}_brin")} '
+                f'ON {quote_name(table)} USING brin ({quote_name(column)}) '
+                f'WITH (pages_per_range = {CREATED_AT_BRIN_PAGES_PER_RANGE})'
+            )
+    except DatabaseError as e:
+        logger.warning("BRIN 索引创建失败: %s", e)
+
+
+@receiver(post_save, sender=User)
+def user_count_cache_handler(sender, instance, created, update_fields=None, **kwargs):
+    """
+    用户总数缓存清除处理器
+    
+    用户创建或删除标记可能变更时清除用户总数估算值缓存。
+    
+    Args:
+        sender: 发送信号的模型类
+        instance: 用户实例
+        created: 是否为新创建
+        update_fields: 本次保存更新的字段（全部保存时为 None）
+        kwargs: 其他参数
+    """
+    if created or update_fields is None or 'is_deleted' in update_fields:
+        UserService.invalidate_active_user_count()
+
+
+@receiver(post_delete, sender=User)
+def user_count_deleted_handler(sender, instance, **kwargs):
+    """
+    用户删除时清除用户总数估算值缓存
+    
+    Args:
+        sender: 发送信号的模型类
+        instance: 被删除的用户实例
+        kwargs: 其他参数
+    """
+    UserService.invalidate_active_user_count()
+
+
 # 连接信号
 # 注意：信号会在应用加载时自动连接，不需要手动调用
\ No newline at end of file
@@ -7,6 +7,8 @@ from django.shortcuts import render
 from django.shortcuts import redirect
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_http_methods
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
 from django.http import HttpRequest, HttpResponse
 from django.contrib.auth import logout as django_logout
 import logging
@@ -14,11 +16,16 @@ import logging
 # 配置日志记录器
 logger = logging.getLogger(__name__)
 
+# 匿名用户首页缓存时间（秒）
+HOME_PAGE_CACHE_TIMEOUT = 60 * 5
+
 
 def home_view(request: HttpRequest) -> HttpResponse:
     """
     首页视图
     
+    匿名用户看到的首页内容相同，使用页面缓存；已登录用户每次渲染。
+    
     Args:
         request: HTTP请求对象
         
@@ -28,6 +35,21 @@ def home_view(request: HttpRequest) -> HttpResponse:
     Raises:
         Exception: 渲染模板时发生错误
     """
+    if request.user.is_authenticated:
+        return _render_home(request)
+    return _cached_home(request)
+
+
+def _render_home(request: HttpRequest) -> HttpResponse:
+    """
+    渲染首页
+    
+    Args:
+        request: HTTP请求对象
+        
+    Returns:
+        HttpResponse: 渲染后的首页响应
+    """
     try:
         context = {
             'title': 'Django Ninja Web应用',
@@ -42,6 +64,10 @@ def home_view(request: HttpRequest) -> HttpResponse:
         raise
 
 
+# 匿名用户的首页（显式声明 Vary: Cookie，携带会话的请求不会命中他人的缓存）
+_cached_home = cache_page(HOME_PAGE_CACHE_TIMEOUT)(vary_on_cookie(_render_home))
+
+
 def login_view(request: HttpRequest) -> HttpResponse:
     """
     登录页面视图
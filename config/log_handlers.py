@@ -0,0 +1,58 @@
+"""
+日志处理器
+
+提供基于队列的异步日志处理器，请求线程只负责将日志记录放入队列，
+由后台监听线程统一写入控制台、文件等实际输出处理器。
+"""
+
+import atexit
+import queue
+from logging.config import ConvertingList
+from logging.handlers import QueueHandler, QueueListener
+
+
+class QueueListenerHandler(QueueHandler):
+    """
+    队列日志处理器
+
+    在 LOGGING 配置中通过 `cfg://handlers.<name>` 引用已配置的输出处理器，
+    日志记录由 `QueueListener` 后台线程转交给这些处理器，避免请求线程执行 I/O。
+    """
+
+    def __init__(self, handlers, respect_handler_level=True):
+        """
+        初始化队列处理器并启动监听线程
+
+        Args:
+            handlers: 实际输出日志的处理器列表
+            respect_handler_level: 是否按各处理器自身的级别过滤日志
+        """
+        # SimpleQueue 由 C 实现，放入记录时无需额外加锁
+        super().__init__(queue.SimpleQueue())
+
+        # 解析 dictConfig 传入的处理器引用
+        if isinstance(handlers, ConvertingList):
+            handlers = [handlers[i] for i in range(len(handlers))]
+
+        self.listener = QueueListener(
+            self.queue, *handlers, respect_handler_level=respect_handler_level
+        )
+        self.listener.start()
+
+        # 进程退出前处理完队列中剩余的日志
+        atexit.register(self.listener.stop)
+
+    def prepare(self, record):
+        """
+        准备入队的日志记录
+
+        队列只在本进程内使用，记录无需序列化，因此不在请求线程中格式化消息
+        和异常堆栈，直接入队，由监听线程中的各输出处理器完成格式化。
+
+        Args:
+            record: 日志记录
+
+        Returns:
+            logging.LogRecord: 原日志记录
+        """
+        return record
@@ -76,8 +76,11 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-# 如果是调试模式且不在测试中，添加调试工具栏
-if DEBUG and not TESTING:
+# 调试工具栏开关（默认在调试模式且不在测试中启用，可通过环境变量单独关闭）
+ENABLE_DEBUG_TOOLBAR = config('ENABLE_DEBUG_TOOLBAR', default=DEBUG and not TESTING, cast=bool)
+
+# 启用时添加调试工具栏
+if ENABLE_DEBUG_TOOLBAR:
     INSTALLED_APPS.append('debug_toolbar')
     MIDDLEWARE.append('debug_toolbar.middleware.DebugToolbarMiddleware')
     
@@ -116,11 +119,27 @@ WSGI_APPLICATION = 'config.wsgi.application'
 DATABASES = {
     'default': dj_database_url.config(
         default=config('DATABASE_URL', default='sqlite:///db.sqlite3'),
-        conn_max_age=600,
+        conn_max_age=config('DATABASE_CONN_MAX_AGE', default=600, cast=int),
         conn_health_checks=True,
     )
 }
 
+# 是否经由 PgBouncer（事务池模式）连接 PostgreSQL
+DATABASE_PGBOUNCER = config('DATABASE_PGBOUNCER', default=False, cast=bool)
+
+if DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    # psycopg3 使用服务端参数绑定，重复执行的查询可复用预备语句；
+    # PgBouncer 事务池模式下连接会在事务间切换，预备语句和服务端游标均不可用
+    DATABASES['default'].setdefault('OPTIONS', {})['server_side_binding'] = not DATABASE_PGBOUNCER
+    DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = DATABASE_PGBOUNCER
+
+# 密码哈希配置（首个为默认算法，其余用于校验旧密码并在登录时自动升级）
+PASSWORD_HASHERS = [
+    'apps.authentication.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
 # 密码验证配置
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -163,6 +182,13 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # 认证配置
 AUTH_USER_MODEL = 'users.User'  # 自定义用户模型
 
+# 认证后端（会话加载用户时一并查询用户资料）
+# 保留 ModelBackend：已有会话记录的是其路径，移除后这些会话会失效
+AUTHENTICATION_BACKENDS = [
+    'apps.authentication.backends.ProfileModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
 # CORS 配置
 CORS_ALLOWED_ORIGINS = config(
     'CORS_ALLOWED_ORIGINS',
@@ -178,11 +204,12 @@ JWT_EXPIRATION_HOURS = config('JWT_EXPIRATION_HOURS', default=24, cast=int)
 JWT_REFRESH_EXPIRATION_DAYS = config('JWT_REFRESH_EXPIRATION_DAYS', default=7, cast=int)
 
 # 缓存配置
-if TESTING:
-    # 测试环境使用内存缓存
+# 测试和开发环境均使用内存缓存；设置 TESTING_CACHE=dummy 时改用空缓存，
+# 用于不关心缓存行为、只追求速度的调试运行
+if TESTING and config('TESTING_CACHE', default='') == 'dummy':
     CACHES = {
         'default': {
-            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
         }
     }
 else:
@@ -233,14 +260,19 @@ LOGGING = {
             'backupCount': 10,
             'formatter': 'verbose',
         },
+        # 队列处理器：请求线程只入队日志记录，由后台线程写入控制台和文件
+        'queue': {
+            'class': 'config.log_handlers.QueueListenerHandler',
+            'handlers': ['cfg://handlers.console', 'cfg://handlers.file'],
+        },
     },
     'root': {
-        'handlers': ['console', 'file'],
+        'handlers': ['queue'],
         'level': 'INFO',
     },
     'loggers': {
         'django': {
-            'handlers': ['console', 'file'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
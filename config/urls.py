@@ -27,10 +27,10 @@ urlpatterns = [
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
-    
-    # 调试工具栏（仅在非测试环境下启用）
-    if not settings.TESTING:
-        import debug_toolbar
-        urlpatterns = [
-            path('__debug__/', include(debug_toolbar.urls)),
-        ] + urlpatterns
\ No newline at end of file
+
+# 调试工具栏（由 ENABLE_DEBUG_TOOLBAR 控制）
+if settings.ENABLE_DEBUG_TOOLBAR:
+    import debug_toolbar
+    urlpatterns = [
+        path('__debug__/', include(debug_toolbar.urls)),
+    ] + urlpatterns
\ No newline at end of file
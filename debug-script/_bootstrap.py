@@ -0,0 +1,82 @@
+"""
+调试脚本共享启动模块
+
+统一设置 Django 测试环境并初始化 Django。调试脚本只需 `import _bootstrap`，
+同一进程中无论导入多少次，`django.setup()` 都只执行一次。
+调试脚本通过 `get_client()` 共享同一个测试客户端，通过 `get_debug_user()` 复用同一个调试用户。
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import django
+
+# 将项目根目录添加到 Python 路径
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# 设置 Django 环境（强制测试模式）
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+os.environ['TESTING'] = 'True'
+
+# Django 是否已初始化
+_READY = False
+
+# 共享的测试客户端（首次使用时创建）
+_client = None
+
+# 调试用户的用户名、邮箱和密码
+DEBUG_USERNAME = 'debug_script_user'
+DEBUG_EMAIL = 'debug_script_user@example.com'
+DEBUG_PASSWORD = 'testpass123'
+
+
+def setup() -> None:
+    """初始化 Django（重复调用时直接返回）"""
+    global _READY
+    if not _READY:
+        django.setup()
+        _READY = True
+
+
+setup()
+
+
+def get_client():
+    """
+    获取共享的测试客户端
+
+    同一进程中的调试脚本复用一个客户端实例，每次获取时清空 Cookie，
+    避免上一个脚本的会话影响当前脚本。
+
+    Returns:
+        django.test.Client: 测试客户端
+    """
+    global _client
+    if _client is None:
+        from django.test import Client
+        _client = Client()
+    _client.cookies.clear()
+    return _client
+
+
+def get_debug_user():
+    """
+    获取调试用户
+
+    调试用户不存在时创建，之后的运行直接复用，避免每次运行都插入新用户并计算密码哈希。
+
+    Returns:
+        User: 调试用户
+    """
+    from apps.users.models import User
+    user = User.objects.filter(username=DEBUG_USERNAME).first()
+    if user is None:
+        user = User.objects.create_user(
+            username=DEBUG_USERNAME,
+            email=DEBUG_EMAIL,
+            password=DEBUG_PASSWORD,
+        )
+    return user
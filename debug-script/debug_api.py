@@ -1,17 +1,12 @@
 #!/usr/bin/env python
 """调试API端点"""
 
-import os
-import django
-from django.test import Client
 import json
 
 # 设置 Django 环境
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ['TESTING'] = 'True'
-django.setup()
+import _bootstrap
 
-client = Client()
+client = _bootstrap.get_client()
 
 # 测试注册端点
 print("测试注册端点...")
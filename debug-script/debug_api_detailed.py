@@ -1,17 +1,27 @@
 #!/usr/bin/env python
 """详细调试API端点"""
 
-import os
-import django
-from django.test import Client
 import json
+import orjson
 
 # 设置 Django 环境
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ['TESTING'] = 'True'
-django.setup()
+import _bootstrap
+
+client = _bootstrap.get_client()
+
+
+def post_json(url, data):
+    """
+    发送 JSON POST 请求
+
+    不自动跟随重定向（端点已直接返回最终状态时无需额外请求），
+    只在返回重定向时打印目标地址。
+    """
+    response = client.post(url, data=orjson.dumps(data), content_type='application/json')
+    if response.status_code in (301, 302):
+        print(f"重定向到: {response['Location']}")
+    return response
 
-client = Client()
 
 # 测试注册端点 - 详细版本
 print("测试注册端点 - 详细版本...")
@@ -23,12 +33,7 @@ registration_data = {
     'nickname': '测试用户'
 }
 
-response = client.post(
-    '/api/users/register', 
-    data=json.dumps(registration_data),
-    content_type='application/json',
-    follow=True  # 跟随重定向
-)
+response = post_json('/api/users/register', registration_data)
 
 print(f"Status code: {response.status_code}")
 print(f"Response: {response.content.decode()}")
@@ -41,25 +46,13 @@ login_data = {
     'password': 'testpass123'
 }
 
-response = client.post(
-    '/api/auth/login',
-    data=json.dumps(login_data),
-    content_type='application/json',
-    follow=True
-)
+response = post_json('/api/auth/login', login_data)
 
 print(f"Status code: {response.status_code}")
 print(f"Response: {response.content.decode()[:200]}...")
 
-# 测试带授权头的用户信息获取
+# 测试带授权头的用户信息获取（复用上面登录获取的令牌，无需再次登录）
 print("\n测试获取用户信息...")
-# 首先登录获取令牌
-response = client.post(
-    '/api/auth/login',
-    data=json.dumps({'username': 'testuser', 'password': 'testpass123'}),
-    content_type='application/json'
-)
-
 if response.status_code == 200:
     data = json.loads(response.content)
     if 'access_token' in data:
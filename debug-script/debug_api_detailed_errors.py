@@ -1,18 +1,13 @@
 #!/usr/bin/env python
 """详细API错误调试"""
 
-import os
-import django
-from django.test import Client
 import json
 import traceback
 
 # 设置 Django 环境
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ['TESTING'] = 'True'
-django.setup()
+import _bootstrap
 
-client = Client(HTTP_HOST='testserver')
+client = _bootstrap.get_client()
 
 # 测试新用户注册 - 应该工作
 print("测试新用户注册...")
@@ -1,20 +1,15 @@
 #!/usr/bin/env python
 """调试API注册错误"""
 
-import os
-import django
 from django.conf import settings
 
 # 设置 Django 环境
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ['TESTING'] = 'True'  # 强制设置为测试模式
-django.setup()
+import _bootstrap
 
-from django.test import Client
 import json
 
 # 创建测试客户端
-client = Client()
+client = _bootstrap.get_client()
 
 # 测试用户注册
 registration_data = {
@@ -1,28 +1,18 @@
 #!/usr/bin/env python
 """测试认证服务中的JWT过期时间问题"""
 
-import os
-import django
 from django.conf import settings
 from datetime import timedelta
 
 # 设置 Django 环境
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ['TESTING'] = 'True'  # 强制设置为测试模式
-django.setup()
+import _bootstrap
 
 from apps.authentication.services import AuthService
-from apps.users.models import User
-import uuid
 
-# 创建测试用户
-user = User.objects.create_user(
-    username=f'testuser_{uuid.uuid4().hex[:8]}',
-    email=f'test_{uuid.uuid4().hex[:8]}@example.com',
-    password='testpass123'
-)
+# 获取调试用户
+user = _bootstrap.get_debug_user()
 
-print(f"用户创建成功: {user.username} (ID: {user.id})")
+print(f"调试用户: {user.username} (ID: {user.id})")
 
 # 测试认证服务中的令牌生成
 print("\n=== 测试认证服务生成密码重置令牌 ===")
@@ -4,12 +4,10 @@
 import os
 import sys
 
-# 在导入 Django 之前设置测试环境
-os.environ['TESTING'] = 'True'
-os.environ['DJANGO_SETTINGS_MODULE'] = 'config.settings'
+# 设置 Django 环境
+import _bootstrap  # noqa: F401
 
 import django
-django.setup()
 
 from django.conf import settings
 from django.core.cache import cache
@@ -23,11 +21,13 @@ print(f"缓存配置: {settings.CACHES}")
 print(f"缓存后端类型: {type(cache)}")
 print(f"缓存后端模块: {cache.__class__.__module__}")
 
-# 检查缓存后端的实际类型
-from django.core.cache.backends.locmem import LocMemCache
-if hasattr(cache, '_cache'):
-    print(f"缓存后端实例: {type(cache._cache)}")
-    print(f"是 LocMemCache 吗: {isinstance(cache._cache, LocMemCache)}")
+# 检查缓存后端的实际类型（仅在配置为本地内存缓存时导入 LocMemCache）
+cache_backend = settings.CACHES['default']['BACKEND']
+print(f"配置的缓存后端: {cache_backend}")
+if cache_backend == 'django.core.cache.backends.locmem.LocMemCache':
+    from django.core.cache import caches
+    from django.core.cache.backends.locmem import LocMemCache
+    print(f"是 LocMemCache 吗: {isinstance(caches['default'], LocMemCache)}")
 
 # 测试缓存操作
 try:
@@ -1,22 +1,22 @@
 #!/usr/bin/env python
 """详细错误诊断"""
 
-import os
-import django
-from django.test import Client
 import json
 import logging
+import os
 
-# 设置 Django 环境
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ['TESTING'] = 'True'
+# 配置日志（设置 DEBUG_VERBOSE 时输出 Django 调试日志，默认只输出警告及以上）
+if os.environ.get('DEBUG_VERBOSE'):
+    logging.basicConfig(level=logging.DEBUG)
+    logging.getLogger('django').setLevel(logging.DEBUG)
+else:
+    logging.basicConfig(level=logging.WARNING)
 
-# 配置日志
-logging.basicConfig(level=logging.DEBUG)
-logger = logging.getLogger('django')
-logger.setLevel(logging.DEBUG)
+# 不输出 SQL 语句
+logging.getLogger('django.db.backends').setLevel(logging.WARNING)
 
-django.setup()
+# 设置 Django 环境
+import _bootstrap
 
 from django.conf import settings
 
@@ -25,7 +25,7 @@ print(f"TESTING: {settings.TESTING}")
 print(f"DEBUG: {settings.DEBUG}")
 print(f"ALLOWED_HOSTS: {settings.ALLOWED_HOSTS}")
 
-client = Client(HTTP_HOST='testserver')
+client = _bootstrap.get_client()
 
 # 测试简单的根路径
 print("\n测试根路径...")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""
+调试JWT签发与过期问题
+
+按不同过期时长签发重置令牌并立即校验，合并了原有的时区、过期时间和详细调试脚本。
+朴素 UTC 场景使用 `datetime.utcnow().timestamp()` 计算签发时间，用于复现时区偏差。
+"""
+
+from datetime import datetime, timezone
+import time
+
+import jwt
+from django.conf import settings
+
+# 设置 Django 环境
+import _bootstrap
+
+from apps.authentication.services import _encode_jwt
+
+# 测试的过期时长（小时）
+HOURS = (1, 2, 6, 12, 24, 48, 168)
+
+
+def setup():
+    """
+    准备调试数据
+
+    Returns:
+        User: 调试用户
+    """
+    user = _bootstrap.get_debug_user()
+    print(f"调试用户: {user.username} (ID: {user.id})")
+    return user
+
+
+def run(user, hours, naive_utc=False):
+    """
+    签发并校验一个令牌
+
+    Args:
+        user: 调试用户
+        hours: 过期时长（小时）
+        naive_utc: 是否用朴素 UTC 时间计算签发时间（非 UTC 时区下会产生偏差）
+
+    Returns:
+        bool: 令牌是否校验通过
+    """
+    iat = int(datetime.utcnow().timestamp()) if naive_utc else int(time.time())
+    payload = {
+        'user_id': user.id,
+        'token_type': 'reset',
+        'exp': iat + hours * 3600,
+        'iat': iat,
+        'jti': f'test_jti_{hours}',
+    }
+    token = _encode_jwt(payload)
+
+    now_ts = int(time.time())
+    print(f"\n=== {hours} 小时过期{'（朴素 UTC）' if naive_utc else ''} ===")
+    print(f"签发时间 (UTC): {datetime.fromtimestamp(iat, timezone.utc)}")
+    print(f"过期时间 (UTC): {datetime.fromtimestamp(payload['exp'], timezone.utc)}")
+    print(f"签发时间与当前时间差 (秒): {iat - now_ts}")
+    print(f"剩余有效期 (秒): {payload['exp'] - now_ts}")
+
+    try:
+        jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        print("✓ 解码成功")
+        return True
+    except jwt.ExpiredSignatureError as e:
+        print(f"✗ 令牌已过期: {e}")
+    except jwt.InvalidTokenError as e:
+        print(f"✗ 令牌无效: {e}")
+    return False
+
+
+def main():
+    """依次运行全部场景"""
+    print(f"JWT 算法: {settings.JWT_ALGORITHM}")
+    print(f"当前时间 (UTC): {datetime.now(timezone.utc)}")
+    print(f"当前时间 (本地): {datetime.now().astimezone()}")
+
+    user = setup()
+    failures = [
+        (hours, naive_utc)
+        for naive_utc in (False, True)
+        for hours in HOURS
+        if not run(user, hours, naive_utc)
+    ]
+
+    print(f"\n失败场景: {failures or '无'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,17 +2,13 @@
 """
 调试密码更新错误的脚本 - 简化版
 """
-import os
 import sys
 import django
 
-# 设置 Django 环境和测试模式
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ['TESTING'] = 'True'  # 强制设置测试模式
-django.setup()
+# 设置 Django 环境
+import _bootstrap
 
 import json
-from django.test import Client
 from apps.users.models import User
 
 def test_password_update():
@@ -35,7 +31,7 @@ def test_password_update():
         print("创建新测试用户")
     
     # 登录获取令牌
-    client = Client()
+    client = _bootstrap.get_client()
     login_response = client.post('/api/auth/login', 
         data=json.dumps({
             'username': 'testuser',
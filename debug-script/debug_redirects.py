@@ -1,17 +1,14 @@
 #!/usr/bin/env python
 """测试URL重定向问题"""
 
-import os
-import django
-from django.test import Client
-import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # 设置 Django 环境
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ['TESTING'] = 'True'
-django.setup()
+import _bootstrap
 
-client = Client(HTTP_HOST='testserver')
+from django.db import connection
+from django.test import Client
 
 # 测试不同的URL变体
 test_urls = [
@@ -25,10 +22,33 @@ test_urls = [
     '/api/auth/login/',
 ]
 
+# 每个工作线程使用独立的测试客户端（客户端的 Cookie 等状态不是线程安全的）
+_local = threading.local()
+
+
+def probe(url):
+    """在工作线程中请求 URL，不跟随重定向"""
+    if not hasattr(_local, 'client'):
+        _local.client = Client()
+    try:
+        return _local.client.get(url, follow=False)
+    finally:
+        # 工作线程各自持有数据库连接，请求结束后关闭
+        connection.close()
+
+
+# 并发请求全部 URL，按原顺序输出结果
+with ThreadPoolExecutor(max_workers=len(test_urls)) as executor:
+    responses = dict(zip(test_urls, executor.map(probe, test_urls)))
+
+# 已请求过的 URL 的状态码（重定向目标多为列表中的另一个 URL，直接复用结果）
+status_codes = {url: response.status_code for url, response in responses.items()}
+
+client = _bootstrap.get_client()
+
 print("测试URL重定向行为:")
-for url in test_urls:
+for url, response in responses.items():
     print(f"\n测试: {url}")
-    response = client.get(url, follow=False)
     print(f"  状态码: {response.status_code}")
     if response.status_code in [301, 302]:
         location = response.get('Location', '无Location头')
@@ -36,11 +56,12 @@ for url in test_urls:
         
         # 跟随重定向
         if location:
-            follow_response = client.get(location)
-            print(f"  重定向后状态码: {follow_response.status_code}")
+            if location not in status_codes:
+                status_codes[location] = client.get(location).status_code
+            print(f"  重定向后状态码: {status_codes[location]}")
     elif response.status_code == 200:
         print(f"  成功访问")
     elif response.status_code == 404:
         print(f"  未找到")
     else:
-        print(f"  响应: {response.content.decode()[:100]}...")
\ No newline at end of file
+        print(f"  响应: {response.content.decode()[:100]}...")
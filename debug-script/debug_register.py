@@ -1,18 +1,14 @@
 #!/usr/bin/env python
 """调试注册错误"""
 
-import os
-import django
-from django.test import Client
 import json
+import orjson
 import traceback
 
 # 设置 Django 环境
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ['TESTING'] = 'True'
-django.setup()
+import _bootstrap
 
-client = Client(HTTP_HOST='testserver')
+client = _bootstrap.get_client()
 
 # 测试注册 - 详细错误信息
 print("测试用户注册（详细调试）...")
@@ -27,7 +23,7 @@ registration_data = {
 try:
     response = client.post(
         '/api/users/register',
-        data=json.dumps(registration_data),
+        data=orjson.dumps(registration_data),
         content_type='application/json'
     )
     
@@ -60,7 +56,7 @@ simple_data = {
 
 response = client.post(
     '/api/users/register',
-    data=json.dumps(simple_data),
+    data=orjson.dumps(simple_data),
     content_type='application/json'
 )
 
@@ -78,7 +74,7 @@ existing_data = {
 
 response = client.post(
     '/api/users/register',
-    data=json.dumps(existing_data),
+    data=orjson.dumps(existing_data),
     content_type='application/json'
 )
 
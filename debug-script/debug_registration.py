@@ -12,6 +12,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 django.setup()
 
 import json
+import orjson
 from django.test import Client
 
 def test_registration():
@@ -31,7 +32,7 @@ def test_registration():
     
     response = client.post(
         '/api/users/register',
-        data=json.dumps(registration_data),
+        data=orjson.dumps(registration_data),
         content_type='application/json'
     )
     
@@ -3,23 +3,18 @@
 详细调试注册API的脚本
 """
 
-import os
 import sys
-import django
 
-# 设置Django环境
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ['TESTING'] = 'True'  # 确保在测试模式下运行
-django.setup()
+# 设置 Django 环境
+import _bootstrap
 
 import json
 import traceback
-from django.test import Client
 from apps.users.schemas import UserCreate
 
 def test_registration_detailed():
     """详细测试用户注册"""
-    client = Client()
+    client = _bootstrap.get_client()
     
     registration_data = {
         'username': 'newuser',
@@ -1,15 +1,11 @@
 #!/usr/bin/env python
 """检查设置和CSRF配置"""
 
-import os
-import django
-from django.test import Client
+import asyncio
 import json
 
 # 设置 Django 环境
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ['TESTING'] = 'True'
-django.setup()
+import _bootstrap  # noqa: F401
 
 from django.conf import settings
 
@@ -22,32 +18,45 @@ print(f"CSRF保护: {settings.CSRF_COOKIE_SECURE}")
 from apps.api.api import api
 print(f"API CSRF配置: {api.csrf}")
 
-client = Client()
+from django.test import RequestFactory
+from django.urls import resolve
+
+# 只检查 Ninja 视图自身的响应（CSRF 由 Ninja 在视图内校验），直接调用视图，不经过中间件
+rf = RequestFactory()
+
+
+def call_view(request):
+    """按请求路径解析并直接调用视图（异步视图同步等待结果）"""
+    response = resolve(request.path_info).func(request)
+    if asyncio.iscoroutine(response):
+        response = asyncio.run(response)
+    return response
+
 
 # 测试简单的GET请求
 print("\n测试GET请求...")
-response = client.get('/api/users/register')
+response = call_view(rf.get('/api/users/register'))
 print(f"GET状态码: {response.status_code}")
 print(f"GET响应: {response.content.decode()[:200]}")
 
 # 测试POST请求不带数据
 print("\n测试POST请求（空数据）...")
-response = client.post('/api/users/register')
+response = call_view(rf.post('/api/users/register'))
 print(f"POST状态码: {response.status_code}")
 print(f"POST响应: {response.content.decode()[:200]}")
 
 # 测试POST请求带数据
 print("\n测试POST请求（JSON数据）...")
-response = client.post(
+response = call_view(rf.post(
     '/api/users/register',
     data=json.dumps({'test': 'data'}),
     content_type='application/json'
-)
+))
 print(f"POST JSON状态码: {response.status_code}")
 print(f"POST JSON响应: {response.content.decode()[:200]}")
 
 # 测试健康检查端点（应该总是可访问）
 print("\n测试健康检查端点...")
-response = client.get('/api/health/')
+response = call_view(rf.get('/api/health/'))
 print(f"健康检查状态码: {response.status_code}")
 print(f"健康检查响应: {response.content.decode()[:200]}")
\ No newline at end of file
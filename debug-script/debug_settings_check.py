@@ -2,14 +2,10 @@
 """检查Django设置配置"""
 
 import os
-import django
 from django.conf import settings
 
 # 设置 Django 环境
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ['TESTING'] = 'True'
-
-django.setup()
+import _bootstrap  # noqa: F401
 
 print("Django设置检查:")
 print(f"SETTINGS_MODULE: {os.environ.get('DJANGO_SETTINGS_MODULE')}")
@@ -1,15 +1,10 @@
 #!/usr/bin/env python
 """检查URL配置"""
 
-import os
-import django
-from django.test import Client
 import json
 
 # 设置 Django 环境
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ['TESTING'] = 'True'
-django.setup()
+import _bootstrap
 
 # 检查URL配置
 from django.urls import reverse, resolve
@@ -21,7 +16,7 @@ for url_pattern in api.urls[0]:
     print(f"  Pattern: {url_pattern.pattern}, Name: {url_pattern.name}")
 
 print("\n测试基础URL...")
-client = Client()
+client = _bootstrap.get_client()
 
 # 测试基础API端点
 response = client.get('/api/')
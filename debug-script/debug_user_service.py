@@ -1,15 +1,11 @@
 #!/usr/bin/env python
 """直接测试用户服务"""
 
-import os
-import django
 import json
 import traceback
 
 # 设置 Django 环境
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ['TESTING'] = 'True'
-django.setup()
+import _bootstrap  # noqa: F401
 
 from apps.users.services import UserService
 from apps.users.schemas import UserCreate
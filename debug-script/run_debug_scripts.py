@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""
+批量运行调试脚本
+
+在同一进程中依次运行 debug_*.py，Django 只初始化一次（应用注册表、配置、
+URL 解析器均复用），避免每个脚本各自冷启动。
+
+用法:
+    python debug-script/run_debug_scripts.py [脚本名 ...]
+"""
+
+import runpy
+import sys
+import traceback
+from pathlib import Path
+
+# 设置 Django 环境
+import _bootstrap  # noqa: F401
+
+# 调试脚本所在目录
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+
+def run_scripts(names=None) -> int:
+    """
+    依次运行调试脚本
+
+    Args:
+        names: 要运行的脚本文件名列表，为空时运行全部 debug_*.py
+
+    Returns:
+        int: 运行失败的脚本数量
+    """
+    scripts = [SCRIPT_DIR / name for name in names] if names else sorted(SCRIPT_DIR.glob('debug_*.py'))
+    failures = []
+    for script in scripts:
+        print(f"\n===== {script.name} =====")
+        try:
+            runpy.run_path(str(script), run_name='__main__')
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                failures.append(script.name)
+        except Exception:
+            traceback.print_exc()
+            failures.append(script.name)
+
+    print(f"\n运行 {len(scripts)} 个脚本，失败 {len(failures)} 个")
+    for name in failures:
+        print(f"  - {name}")
+    return len(failures)
+
+
+if __name__ == '__main__':
+    sys.exit(1 if run_scripts(sys.argv[1:]) else 0)
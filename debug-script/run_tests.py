@@ -3,6 +3,7 @@
 测试运行脚本
 
 用于在Windows环境下运行测试，避免调试工具栏干扰
+传入 --keepdb 时保留测试数据库，后续运行跳过建表
 """
 
 import os
@@ -23,7 +24,7 @@ if __name__ == "__main__":
     
     # 获取测试运行器
     TestRunner = get_runner(settings)
-    test_runner = TestRunner(verbosity=2, interactive=False)
+    test_runner = TestRunner(verbosity=2, interactive=False, keepdb='--keepdb' in sys.argv)
     
     # 运行测试
     failures = test_runner.run_tests(['tests'])
@@ -12,7 +12,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 os.environ['TESTING'] = 'True'  # 确保在测试模式下运行
 django.setup()
 
-from apps.api.api import AuthBearer
+from apps.api.auth import AuthBearer
 from django.test import RequestFactory
 
 class MockRequest:
@@ -0,0 +1,49 @@
+"""
+API 响应工具测试
+
+测试业务码与统一响应构建方法。
+"""
+
+from django.test import SimpleTestCase
+
+from apps.api.response import BUSINESS_CODE_LABELS, ApiResponse, BusinessCode
+
+
+class BusinessCodeTest(SimpleTestCase):
+    """业务码测试类"""
+    
+    def test_every_code_has_label(self):
+        """测试每个业务码都定义了标签"""
+        codes = [value for name, value in vars(BusinessCode).items() if name.isupper()]
+        
+        self.assertTrue(codes)
+        for code in codes:
+            self.assertIsInstance(code, BusinessCode)
+            self.assertIn(code, BUSINESS_CODE_LABELS)
+        self.assertEqual(len(codes), len(BUSINESS_CODE_LABELS))
+    
+    def test_code_is_int_with_label(self):
+        """测试业务码可作为整数使用并带有标签"""
+        self.assertEqual(BusinessCode.OK, 0)
+        self.assertEqual(BusinessCode.OK.label, "操作成功")
+        self.assertEqual(str(BusinessCode.NOT_FOUND), "100404")
+        
+        with self.assertRaises(AttributeError):
+            BusinessCode.OK.label = "其他"
+    
+    def test_lookup_by_value(self):
+        """测试按整型值查找业务码"""
+        self.assertIs(BusinessCode(100401), BusinessCode.UNAUTHORIZED)
+        self.assertEqual(BusinessCode.get_label(100401), "未认证")
+        self.assertIsNone(BusinessCode.get_label(1))
+        
+        with self.assertRaises(ValueError):
+            BusinessCode(1)
+    
+    def test_error_payload_uses_label(self):
+        """测试错误响应默认使用业务码标签"""
+        payload, status = ApiResponse.not_found()
+        
+        self.assertEqual(status, 404)
+        self.assertEqual(payload['code'], BusinessCode.NOT_FOUND)
+        self.assertEqual(payload['message'], "资源不存在")
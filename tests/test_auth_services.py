@@ -6,6 +6,7 @@
 
 from django.test import TestCase
 from django.contrib.auth import get_user_model
+from django.contrib.auth.signals import user_login_failed
 from django.core.exceptions import ValidationError
 from django.conf import settings
 from django.utils import timezone
@@ -46,6 +47,18 @@ class AuthServiceTest(TestCase):
         self.assertEqual(token_data['user_id'], self.user.id)
         self.assertEqual(token_data['expires_in'], settings.JWT_EXPIRATION_HOURS * 3600)
     
+    def test_generated_token_is_standard_jwt(self):
+        """测试生成的令牌可被 PyJWT 正常解码"""
+        token_data = AuthService.generate_tokens(self.user)
+        access_token = token_data['access_token']
+        
+        header = jwt.get_unverified_header(access_token)
+        self.assertEqual(header, {'alg': settings.JWT_ALGORITHM, 'typ': 'JWT'})
+        
+        payload = jwt.decode(access_token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        self.assertEqual(payload['user_id'], self.user.id)
+        self.assertEqual(payload['token_type'], 'access')
+    
     def test_verify_token_success(self):
         """测试成功验证令牌"""
         # 生成令牌
@@ -57,6 +70,17 @@ class AuthServiceTest(TestCase):
         
         self.assertEqual(user_id, self.user.id)
     
+    def test_verify_and_decode_success(self):
+        """测试验证令牌并返回过期时间"""
+        token_data = AuthService.generate_tokens(self.user)
+        
+        result = AuthService.verify_and_decode(token_data['access_token'])
+        
+        self.assertIsNotNone(result)
+        user_id, exp = result
+        self.assertEqual(user_id, self.user.id)
+        self.assertGreater(exp, timezone.now().timestamp())
+    
     def test_verify_token_invalid(self):
         """测试验证无效令牌"""
         # 测试空令牌
@@ -81,6 +105,23 @@ class AuthServiceTest(TestCase):
         user_id = AuthService.verify_token(expired_token)
         self.assertIsNone(user_id)
     
+    def test_verify_token_tampered(self):
+        """测试验证被篡改或缺少过期时间的令牌"""
+        token_data = AuthService.generate_tokens(self.user)
+        header, payload, signature = token_data['access_token'].split('.')
+        
+        # 篡改签名
+        tampered = f"{header}.{payload}.{signature[:-2]}{'AA' if signature[-2:] != 'AA' else 'BB'}"
+        self.assertIsNone(AuthService.verify_token(tampered))
+        
+        # 缺少过期时间
+        no_exp_token = jwt.encode(
+            {'user_id': self.user.id, 'token_type': 'access'},
+            settings.JWT_SECRET_KEY,
+            algorithm=settings.JWT_ALGORITHM
+        )
+        self.assertIsNone(AuthService.verify_token(no_exp_token))
+    
     def test_verify_token_wrong_type(self):
         """测试验证错误类型的令牌"""
         # 生成刷新令牌（但验证时期望访问令牌）
@@ -111,6 +152,19 @@ class AuthServiceTest(TestCase):
         user_id = AuthService.verify_token(access_token)
         self.assertIsNone(user_id)
     
+    def test_verify_token_after_status_change(self):
+        """测试用户状态变更后缓存的有效状态被清除"""
+        token_data = AuthService.generate_tokens(self.user)
+        access_token = token_data['access_token']
+        
+        # 首次验证会缓存用户有效状态
+        self.assertEqual(AuthService.verify_token(access_token), self.user.id)
+        
+        # 修改用户状态后验证应失败
+        self.user.status = 'suspended'
+        self.user.save(update_fields=['status'])
+        self.assertIsNone(AuthService.verify_token(access_token))
+    
     def test_refresh_access_token_success(self):
         """测试成功刷新访问令牌"""
         # 生成令牌
@@ -157,6 +211,38 @@ class AuthServiceTest(TestCase):
         user = AuthService.authenticate_user(self.user_data['username'], 'wrongpassword')
         self.assertIsNone(user)
     
+    def test_authenticate_user_failure_sends_signal(self):
+        """测试认证失败时发送登录失败信号"""
+        received = []
+        
+        def handler(sender, credentials, **kwargs):
+            received.append(credentials)
+        
+        user_login_failed.connect(handler)
+        try:
+            user = AuthService.authenticate_user(self.user_data['username'], 'wrongpassword')
+        finally:
+            user_login_failed.disconnect(handler)
+        
+        self.assertIsNone(user)
+        self.assertEqual(received, [{'username': self.user_data['username']}])
+    
+    def test_authenticate_user_falls_back_to_next_match(self):
+        """测试用户名匹配的用户密码不符时，回退到邮箱匹配的用户"""
+        other_user = User.objects.create_user(
+            username=self.user_data['email'],
+            email='other@example.com',
+            password='otherpassword123'
+        )
+        
+        # 用户名匹配优先
+        user = AuthService.authenticate_user(self.user_data['email'], 'otherpassword123')
+        self.assertEqual(user, other_user)
+        
+        # 用户名匹配的用户密码不符时，邮箱匹配的用户仍可登录
+        user = AuthService.authenticate_user(self.user_data['email'], self.user_data['password'])
+        self.assertEqual(user, self.user)
+    
     def test_authenticate_user_invalid_username(self):
         """测试认证用户时用户名错误"""
         user = AuthService.authenticate_user('wrongusername', self.user_data['password'])
@@ -5,10 +5,13 @@
 """
 
 import json
+import jwt
+from datetime import datetime
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from tests.base import APITestCase
+from apps.authentication.services import AuthService
 
 # 获取用户模型
 User = get_user_model()
@@ -79,6 +82,25 @@ class UserAPITest(APITestCase):
         
         self.assertEqual(response.status_code, 422)  # 应该返回验证错误
     
+    def test_user_registration_duplicate_email(self):
+        """测试用户注册重复邮箱"""
+        registration_data = {
+            'username': 'differentuser',
+            'email': self.user_data['email'],  # 已存在的邮箱
+            'password': 'newpassword123',
+            'password_confirm': 'newpassword123',
+        }
+        
+        response = self.client.post(
+            '/api/users/register',
+            data=json.dumps(registration_data),
+            content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 422)
+        self.assertIn('邮箱', json.loads(response.content)['detail'])
+        self.assertFalse(User.objects.filter(username='differentuser').exists())
+    
     def test_get_current_user_info(self):
         """测试获取当前用户信息"""
         # 登录获取令牌
@@ -93,12 +115,43 @@ class UserAPITest(APITestCase):
         self.assertEqual(data['user']['email'], self.user_data['email'])
         self.assertEqual(data['user']['nickname'], self.user_data['nickname'])
     
+    def test_get_current_user_avatar_url(self):
+        """测试用户信息返回头像地址"""
+        self.user.avatar = 'avatars/2024/01/test.png'
+        self.user.save()
+        self.login()
+        
+        response = self.auth_request('get', '/api/users/me')
+        
+        data = json.loads(response.content)
+        self.assertEqual(data['user']['avatar_url'], '/media/avatars/2024/01/test.png')
+    
     def test_get_current_user_without_auth(self):
         """测试未认证时获取用户信息"""
         response = self.client.get('/api/users/me')
         
         self.assertEqual(response.status_code, 401)  # 未认证
     
+    def test_validate_token(self):
+        """测试验证访问令牌返回用户和过期时间"""
+        token = self.login()
+        
+        response = self.client.post(
+            '/api/auth/validate',
+            data=json.dumps({'token': token}),
+            content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        
+        self.assertTrue(data['valid'])
+        self.assertEqual(data['user_id'], self.user.id)
+        
+        # 过期时间与令牌中的 exp 一致（本地时间，不带时区偏移）
+        exp = jwt.decode(token, options={'verify_signature': False})['exp']
+        self.assertEqual(data['expires_at'], datetime.fromtimestamp(exp).isoformat())
+    
     def test_update_current_user_info(self):
         """测试更新当前用户信息"""
         # 登录获取令牌
@@ -127,6 +180,62 @@ class UserAPITest(APITestCase):
         self.assertEqual(self.user.nickname, update_data['nickname'])
         self.assertEqual(self.user.bio, update_data['bio'])
     
+    def test_get_current_user_after_update(self):
+        """测试更新后获取的当前用户信息不是缓存的旧数据"""
+        self.login()
+        
+        # 首次获取会缓存用户信息
+        response = self.auth_request('get', '/api/users/me')
+        self.assertEqual(response.status_code, 200)
+        
+        self.auth_request(
+            'put',
+            '/api/users/me',
+            data=json.dumps({'nickname': 'Cached Nickname'}),
+            content_type='application/json'
+        )
+        
+        response = self.auth_request('get', '/api/users/me')
+        data = json.loads(response.content)
+        self.assertEqual(data['user']['nickname'], 'Cached Nickname')
+    
+    def test_update_email_resets_verification(self):
+        """测试更新邮箱后重置邮箱验证状态"""
+        self.user.email_verified = True
+        self.user.save()
+        self.login()
+        
+        response = self.auth_request(
+            'put',
+            '/api/users/me',
+            data=json.dumps({'email': 'changed@example.com'}),
+            content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.email, 'changed@example.com')
+        self.assertFalse(self.user.email_verified)
+    
+    def test_update_email_to_existing_email(self):
+        """测试更新为已被占用的邮箱时返回字段提示"""
+        other_user = self.create_test_user(username='otheruser', email='other@example.com')
+        self.login()
+        
+        response = self.auth_request(
+            'put',
+            '/api/users/me',
+            data=json.dumps({'email': other_user.email}),
+            content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 422)
+        data = json.loads(response.content)
+        self.assertEqual(data['message'], f"邮箱 '{other_user.email}' 已存在")
+        
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.email, self.user_data['email'])
+    
     def test_update_user_password(self):
         """测试更新用户密码"""
         # 登录获取令牌
@@ -138,17 +247,20 @@ class UserAPITest(APITestCase):
             'new_password_confirm': 'newsecurepassword123'
         }
         
-        response = self.auth_request(
-            'put',
-            '/api/users/me/password',
-            data=json.dumps(password_data),
-            content_type='application/json'
-        )
+        # 密码通过 save() 写入，密码修改信号处理器应被触发
+        with self.assertLogs('apps.authentication.signals', level='INFO') as logs:
+            response = self.auth_request(
+                'put',
+                '/api/users/me/password',
+                data=json.dumps(password_data),
+                content_type='application/json'
+            )
         
         self.assertEqual(response.status_code, 200)
         data = json.loads(response.content)
         
         self.assertEqual(data['message'], '密码更新成功')
+        self.assertTrue(any('用户密码修改' in line for line in logs.output))
         
         # 验证密码已更新
         self.user.refresh_from_db()
@@ -237,6 +349,11 @@ class UserAPITest(APITestCase):
         self.user.refresh_from_db()
         self.assertTrue(self.user.is_deleted)
         self.assertEqual(self.user.status, 'deleted')
+        
+        # 删除后原令牌不再有效
+        self.assertIsNone(AuthService.verify_token(self.token))
+        response = self.auth_request('get', '/api/users/me')
+        self.assertEqual(response.status_code, 401)
     
     def test_list_users_admin_only(self):
         """测试获取用户列表（管理员功能）"""
@@ -249,6 +366,64 @@ class UserAPITest(APITestCase):
         # 注意：这里假设普通用户没有权限，实际实现可能需要调整
         # self.assertEqual(response.status_code, 403)  # 无权限
     
+    def test_list_users_pagination(self):
+        """测试用户列表分页与游标分页"""
+        self.create_test_user()
+        self.create_test_user()
+        
+        response = self.auth_request('get', '/api/users/', {'limit': 2})
+        self.assertEqual(response.status_code, 200)
+        data = self.get_response_data(response)
+        self.assertEqual(data['count'], 3)
+        self.assertEqual(len(data['items']), 2)
+        
+        # 以上一页最后一个用户作为游标获取剩余用户
+        cursor = data['items'][-1]['id']
+        response = self.auth_request('get', '/api/users/', {'limit': 2, 'cursor': cursor})
+        data = self.get_response_data(response)
+        self.assertEqual(len(data['items']), 1)
+        self.assertNotIn(cursor, [item['id'] for item in data['items']])
+    
+    def test_list_users_filters(self):
+        """测试用户列表过滤条件"""
+        self.create_test_user(username='filtered', email='filtered@example.com')
+        
+        response = self.auth_request('get', '/api/users/', {'username': 'FILTER', 'status': ''})
+        self.assertEqual(response.status_code, 200)
+        data = self.get_response_data(response)
+        self.assertEqual(data['count'], 1)
+        self.assertEqual(data['items'][0]['username'], 'filtered')
+    
+    def test_bulk_user_detail(self):
+        """测试批量获取用户详情"""
+        other_user = self.create_test_user(username='otheruser', email='other@example.com')
+        self.user.user_type = 'admin'
+        self.user.save(update_fields=['user_type'])
+        self.login()
+        
+        response = self.auth_request(
+            'post', '/api/users/bulk',
+            {'ids': [other_user.id, self.user.id, other_user.id, 999999]},
+            content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual([item['user']['id'] for item in data], [other_user.id, self.user.id])
+    
+    def test_bulk_user_detail_requires_admin(self):
+        """测试批量获取用户详情需要管理员身份"""
+        payload = json.dumps({'ids': [self.user.id]})
+        
+        # 未认证
+        response = self.client.post('/api/users/bulk', data=payload, content_type='application/json')
+        self.assertEqual(response.status_code, 401)
+        
+        # 普通用户
+        self.login()
+        response = self.auth_request('post', '/api/users/bulk', {'ids': [self.user.id]}, content_type='application/json')
+        self.assertEqual(response.status_code, 403)
+    
     def test_get_user_detail_admin_only(self):
         """测试获取用户详情（管理员功能）"""
         # 创建另一个用户
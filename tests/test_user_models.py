@@ -117,6 +117,35 @@ class UserModelTest(TestCase):
         user.save()
         self.assertTrue(user.is_fully_verified())
     
+    def test_password_hashed_with_argon2(self):
+        """测试密码默认使用 Argon2 哈希"""
+        user = User.objects.create_user(**self.user_data)
+        
+        self.assertTrue(user.password.startswith('argon2$'))
+        self.assertTrue(user.check_password(self.user_data['password']))
+    
+    def test_welcome_email_sent_after_commit(self):
+        """测试欢迎邮件在事务提交后才安排发送"""
+        with self.captureOnCommitCallbacks() as callbacks:
+            User.objects.create_user(**self.user_data)
+        
+        self.assertEqual(len(callbacks), 1)
+    
+    def test_email_change_resets_verification(self):
+        """测试邮箱变更后重置验证状态"""
+        user = User.objects.create_user(**self.user_data)
+        user.email_verified = True
+        user.save()
+        
+        # 重新加载后修改邮箱
+        user = User.objects.get(pk=user.pk)
+        self.assertTrue(user.email_verified)
+        user.email = 'changed@example.com'
+        user.save()
+        
+        user.refresh_from_db()
+        self.assertFalse(user.email_verified)
+    
     def test_get_display_name(self):
         """测试获取显示名称"""
         user = User.objects.create_user(**self.user_data)
@@ -238,4 +267,9 @@ class UserModelTest(TestCase):
         # 应该自动创建用户资料
         self.assertTrue(hasattr(user, 'profile'))
         self.assertIsNotNone(user.profile)
-        self.assertEqual(user.profile.user, user)
\ No newline at end of file
+        self.assertEqual(user.profile.user, user)
+    
+    def test_user_profile_created_without_lookup(self):
+        """测试创建用户时只插入用户和资料两行，不额外查询资料"""
+        with self.assertNumQueries(2):
+            User.objects.create_user(**self.user_data)